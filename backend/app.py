@@ -15,27 +15,38 @@ Benefits:
 - Better maintainability vs monolithic file
 """
 
+import os
+import signal
+import sys
+
 from flask import Flask, request
 from flask_cors import CORS
 
 # Import route registration functions (each registers related endpoints)
 from routes.event_routes import register_event_routes
 from routes.preference_routes import register_preference_routes
-from routes.score_routes import register_score_routes
+from routes.score_routes import register_score_routes, start_nightly_precompute
 from routes.statistics_routes import register_statistics_routes
 from routes.optimization_routes import register_optimization_routes
 
 # Create Flask app
 app = Flask(__name__)
 
+# CORS settings, computed once at startup instead of per response
+ALLOWED_ORIGINS = frozenset(("http://localhost:5173", "http://localhost:5174"))
+_CORS_METHODS = "GET, POST, PUT, DELETE, OPTIONS"
+_CORS_HEADERS = "Content-Type, Authorization"
+_CORS_MAX_AGE = "86400"  # Browsers may cache preflight results for a day
+
 # Configure CORS (Cross-Origin Resource Sharing)
 # Allows frontend (running on port 5173/5174) to communicate with backend (port 5000)
 # Without this, browsers block the connection for security reasons
 CORS(app, 
-     origins=["http://localhost:5173", "http://localhost:5174"], 
+     origins=sorted(ALLOWED_ORIGINS), 
      supports_credentials=True, 
      methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"], 
-     allow_headers=["Content-Type", "Authorization"])
+     allow_headers=["Content-Type", "Authorization"],
+     max_age=int(_CORS_MAX_AGE))
 
 
 @app.after_request
@@ -44,12 +55,18 @@ def apply_cors_headers(response):
     Ensures CORS headers are present on ALL responses (even errors).
     Flask sometimes removes CORS headers on error responses, causing frontend to fail.
     This guarantees headers are always present so frontend can read error messages.
+    Preflight (OPTIONS) responses also get a Max-Age so browsers skip repeat preflights.
     """
+    headers = response.headers
     origin = request.headers.get('Origin')
-    if origin in ['http://localhost:5173', 'http://localhost:5174']:
-        response.headers['Access-Control-Allow-Origin'] = origin
-    response.headers.setdefault('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-    response.headers.setdefault('Access-Control-Allow-Headers', 'Content-Type, Authorization')
+    if origin in ALLOWED_ORIGINS:
+        headers['Access-Control-Allow-Origin'] = origin
+    if 'Access-Control-Allow-Methods' not in headers:
+        headers['Access-Control-Allow-Methods'] = _CORS_METHODS
+    if 'Access-Control-Allow-Headers' not in headers:
+        headers['Access-Control-Allow-Headers'] = _CORS_HEADERS
+    if request.method == 'OPTIONS':
+        headers['Access-Control-Max-Age'] = _CORS_MAX_AGE
     return response
 
 
@@ -86,26 +103,47 @@ if __name__ == "__main__":
     # host="0.0.0.0" allows connections from other devices on network
     # port=5000 is default Flask port
     # debug=True enables auto-reload on code changes and detailed error pages
-    print("=" * 60)
-    print("Tempora v3 Backend API")
-    print("=" * 60)
-    print("Server starting on http://localhost:5000")
-    print("CORS enabled for: http://localhost:5173, http://localhost:5174")
-    print()
-    print("Modular Structure:")
-    print("  - routes/event_routes.py - Event CRUD endpoints")
-    print("  - routes/preference_routes.py - User preferences")
-    print("  - routes/score_routes.py - Health & productivity scoring")
-    print("  - routes/statistics_routes.py - Weekly analytics")
-    print("  - routes/optimization_routes.py - Schedule optimization")
-    print("  - utils/datetime_utils.py - Date/time parsing")
-    print("  - utils/time_validators.py - Work/sleep hour validation")
-    print("  - utils/gap_calculator.py - Break calculation")
-    print("  - scheduling/slot_finder.py - Smart slot finding & scoring")
-    print("  - scheduling/recurring_handler.py - Recurring event scheduling")
-    print("  - scheduling/floating_handler.py - Floating event scheduling")
-    print("  - scheduling/schedule_state.py - Schedule state management")
-    print("=" * 60)
-    print()
     
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    # Startup banner as one write instead of a print() per line; TEMPORA_QUIET=1 skips it
+    if os.environ.get("TEMPORA_QUIET") != "1":
+        rule = "=" * 60
+        sys.stdout.write(f"""{rule}
+Tempora v3 Backend API
+{rule}
+Server starting on http://localhost:5000
+CORS enabled for: http://localhost:5173, http://localhost:5174
+
+Modular Structure:
+  - routes/event_routes.py - Event CRUD endpoints
+  - routes/preference_routes.py - User preferences
+  - routes/score_routes.py - Health & productivity scoring
+  - routes/statistics_routes.py - Weekly analytics
+  - routes/optimization_routes.py - Schedule optimization
+  - utils/datetime_utils.py - Date/time parsing
+  - utils/time_validators.py - Work/sleep hour validation
+  - utils/gap_calculator.py - Break calculation
+  - scheduling/slot_finder.py - Smart slot finding & scoring
+  - scheduling/recurring_handler.py - Recurring event scheduling
+  - scheduling/floating_handler.py - Floating event scheduling
+  - scheduling/schedule_state.py - Schedule state management
+{rule}
+
+""")
+        sys.stdout.flush()
+    
+    # Turn SIGTERM into a normal exit so atexit handlers run (the database
+    # checkpoints and truncates its WAL file on close)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
+    # Warm the health-score cache every night (see routes/score_routes.py)
+    start_nightly_precompute()
+    
+    if os.environ.get("TEMPORA_PROD") == "1":
+        # Production: gevent's WSGI server handles concurrent requests without
+        # the dev server's reloader and debugger (pip install gevent).
+        # For multiple processes use gunicorn instead, e.g.:
+        #   gunicorn -k gevent -w 4 -b 0.0.0.0:5000 app:app
+        from gevent.pywsgi import WSGIServer
+        WSGIServer(("0.0.0.0", 5000), app).serve_forever()
+    else:
+        app.run(host="0.0.0.0", port=5000, debug=True)
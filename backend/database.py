@@ -5,55 +5,363 @@ Minimal MVP version with core operations only
 
 import sqlite3
 import json
+import logging
 import os
-from datetime import datetime
+import atexit
+import queue
+import threading
+from functools import lru_cache
+from pathlib import Path
 from contextlib import contextmanager
 
+logger = logging.getLogger(__name__)
+
 DB_FILE = "events.db"
 SCHEMA_FILE = "schema.sql"
 
+# Number of read-only connections kept in the reader pool
+READER_POOL_SIZE = min(8, os.cpu_count() or 1)
+
+# Prepared statements kept per connection (sqlite3's default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Applied once when the writer connection is opened.
+# WAL lets readers run while a write is in progress, and synchronous=NORMAL
+# is safe under WAL while skipping an fsync per commit.
+CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -65536;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA busy_timeout = 5000;
+    PRAGMA foreign_keys = ON;
+    PRAGMA journal_size_limit = 67108864;
+"""
+
+# Columns selected for every event query, in the order _row_to_dict unpacks them
+EVENT_COLUMNS = (
+    "id, title, priority, type, category, start_time, end_time, locked, "
+    "parent_id, duration, frequency, earliest_start, deadline, preferred_time, notes"
+)
+
+# "Now" evaluated by SQLite, in the same local 'YYYY-MM-DDTHH:MM:SS' form the
+# events table stores (datetime('now') is UTC with a space separator, which
+# doesn't compare correctly against those strings)
+SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime')"
+
+# INSERT/UPDATE ... RETURNING needs SQLite 3.35+; older builds re-read the row
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# "This and all future instances" of a recurring event, relative to a pivot
+# instance (bound as the only parameter). Siblings share the pivot's parent_id;
+# legacy instances without a parent_id are matched by title/duration/frequency.
+# A pivot that is missing or not a recurring_instance matches nothing.
+FUTURE_INSTANCES_PIVOT = """
+    WITH pivot AS (
+        SELECT parent_id, start_time, title, duration, frequency
+        FROM events
+        WHERE id = ? AND type = 'recurring_instance'
+    )
+"""
+FUTURE_INSTANCES_FILTER = """
+    type = 'recurring_instance'
+    AND parent_id IS (SELECT parent_id FROM pivot)
+    AND start_time >= (SELECT start_time FROM pivot)
+    AND (
+        (SELECT parent_id FROM pivot) IS NOT NULL
+        OR (
+            title = (SELECT title FROM pivot)
+            AND duration = (SELECT duration FROM pivot)
+            AND frequency = (SELECT frequency FROM pivot)
+        )
+    )
+"""
+
+# Reader connections are read-only, so only the per-connection settings apply
+READER_PRAGMAS = """
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -65536;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA busy_timeout = 5000;
+"""
+
+# Connections are shared between request threads (one writer, pooled readers)
+if sqlite3.threadsafety < 1:
+    raise RuntimeError("SQLite must be compiled in multi-thread or serialized mode")
+
+
+@lru_cache(maxsize=1024)
+def _decode_preferred(preferred_json):
+    """Parse a preferred_time JSON string (cached - recurring instances share templates)."""
+    try:
+        decoded = json.loads(preferred_json)
+    except json.JSONDecodeError:
+        return {}
+    return decoded if isinstance(decoded, dict) else {}
+
+
+@lru_cache(maxsize=1024)
+def _encode_preferred_items(items):
+    """Serialize preferred_time from its (key, value) pairs (cached)."""
+    return json.dumps(dict(items))
+
+
+def _encode_preferred(preferred_time):
+    """Serialize a preferred_time dict to JSON, reusing cached encodings when hashable."""
+    try:
+        return _encode_preferred_items(tuple(preferred_time.items()))
+    except TypeError:
+        # Unhashable values (nested lists/dicts) - encode directly
+        return json.dumps(preferred_time)
+
 
 class DatabaseManager:
-    """Manages SQLite database operations for Tempora event system."""
+    """
+    Manages SQLite database operations for Tempora event system.
+    
+    Uses the "1 writer + N readers" pattern: one writer connection guarded by a
+    lock, plus a bounded pool of read-only connections. Under WAL, readers never
+    wait on the writer or on each other.
+    """
+    
+    # Static SQL, built once at class creation instead of per call. Identical
+    # strings also hit the same slot in each connection's statement cache.
+    _SQL_GET_ALL = f"SELECT {EVENT_COLUMNS} FROM events ORDER BY start_time"
+    _SQL_GET_FUTURE = f"""
+        SELECT {EVENT_COLUMNS} FROM events 
+        WHERE end_time >= ?
+        ORDER BY start_time
+    """
+    _SQL_GET_FUTURE_FROM_NOW = f"""
+        SELECT {EVENT_COLUMNS} FROM events 
+        WHERE end_time >= {SQL_NOW}
+        ORDER BY start_time
+    """
+    _SQL_GET_BY_ID = f"SELECT {EVENT_COLUMNS} FROM events WHERE id = ?"
+    _SQL_GET_ID_RANGE = f"SELECT {EVENT_COLUMNS} FROM events WHERE id BETWEEN ? AND ? ORDER BY id"
+    _SQL_EVENTS_VERSION = "SELECT version FROM events_version WHERE id = 1"
+    _SQL_INSERT = """
+        INSERT INTO events (
+            title, priority, type, category, start_time, end_time, locked,
+            parent_id, duration, frequency, earliest_start, deadline, preferred_time, notes
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _SQL_INSERT_RETURNING = _SQL_INSERT + f" RETURNING {EVENT_COLUMNS}"
+    _SQL_DELETE = "DELETE FROM events WHERE id = ?"
+    _SQL_DELETE_FUTURE_INSTANCES = (
+        f"{FUTURE_INSTANCES_PIVOT} DELETE FROM events WHERE {FUTURE_INSTANCES_FILTER}"
+    )
+    _SQL_GET_FUTURE_INSTANCES = (
+        f"{FUTURE_INSTANCES_PIVOT} SELECT id FROM events WHERE {FUTURE_INSTANCES_FILTER}"
+    )
+    _SQL_UPDATE_TIMES = """
+        UPDATE events 
+        SET start_time = ?, end_time = ?, updated_at = CURRENT_TIMESTAMP
+        WHERE id = ?
+    """
+    # Served by idx_events_endtime_starttime (range on end_time)
+    _SQL_IN_RANGE = f"""
+        SELECT {EVENT_COLUMNS} FROM events 
+        WHERE start_time < ? AND end_time > ?
+        ORDER BY start_time
+    """
+    _SQL_STARTING_IN_RANGE = f"""
+        SELECT {EVENT_COLUMNS} FROM events 
+        WHERE start_time >= ? AND start_time <= ?
+        ORDER BY start_time
+    """
+    # Exact integer seconds, so totals match summing Python timedeltas
+    _SQL_CATEGORY_STATS = """
+        SELECT category,
+               COUNT(*),
+               SUM(strftime('%s', end_time) - strftime('%s', start_time)) / 60.0
+        FROM events
+        WHERE start_time >= ? AND start_time <= ?
+        GROUP BY category
+    """
+    # Future-only: only events that end after now can conflict.
+    # Served by idx_events_endtime_starttime; stops at the first match.
+    _SQL_CHECK_CONFLICTS = f"""
+        SELECT 1 FROM events
+        WHERE end_time > ?
+        AND start_time < ?
+        AND end_time >= {SQL_NOW}
+        LIMIT 1
+    """
+    _SQL_CHECK_CONFLICTS_EXCLUDING = f"""
+        SELECT 1 FROM events
+        WHERE end_time > ?
+        AND start_time < ?
+        AND end_time >= {SQL_NOW}
+        AND id != ?
+        LIMIT 1
+    """
+    _SQL_TOGGLE_LOCK = """
+        UPDATE events
+        SET locked = CASE WHEN locked THEN 0 ELSE 1 END, updated_at = CURRENT_TIMESTAMP
+        WHERE id = ?
+    """
+    _SQL_TOGGLE_LOCK_RETURNING = _SQL_TOGGLE_LOCK + f" RETURNING {EVENT_COLUMNS}"
+    _SQL_GET_PREFERENCES = """
+        SELECT sleep_start, sleep_end, work_start, work_end, round_to_minutes
+        FROM user_preferences WHERE user_id = ?
+    """
+    _SQL_UPDATE_PREFERENCES = """
+        UPDATE user_preferences 
+        SET sleep_start = ?,
+            sleep_end = ?,
+            work_start = ?,
+            work_end = ?,
+            round_to_minutes = ?,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE user_id = ?
+    """
     
     def __init__(self, db_path=DB_FILE):
         """Initialize database manager with path to database file."""
         self.db_path = db_path
-        
+        self._writer = None
+        self._writer_lock = threading.RLock()
+        self._writer_depth = 0  # Nesting level of get_writer() (lock is held)
+        self._readers = queue.Queue(maxsize=READER_POOL_SIZE)
+        self._readers_opened = 0
+        self._readers_lock = threading.Lock()
+        self._all_readers = []  # Every reader opened, closed at exit
+        atexit.register(self.close_all)
+    
+    def _open_writer(self):
+        """Open the writer connection (caller holds the writer lock)."""
+        # isolation_level=None: transactions are managed explicitly in get_writer
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        conn.executescript(CONNECTION_PRAGMAS)  # WAL, cache sizing, foreign keys
+        return conn
+    
+    def _open_reader(self):
+        """Open a read-only connection to the database file."""
+        # The writer creates the file and switches it to WAL before any reader opens
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = self._open_writer()
+        uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, isolation_level=None,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        conn.executescript(READER_PRAGMAS)
+        return conn
+    
     @contextmanager
-    def get_connection(self):
-        """Context manager for database connections with proper cleanup."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+    def get_writer(self):
+        """
+        Context manager wrapping one write transaction on the writer connection.
+        Only one thread writes at a time; nested calls join the outer transaction.
+        Commits on success, rolls back on error; the connection itself stays open.
+        """
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = self._open_writer()
+            conn = self._writer
+            outermost = self._writer_depth == 0
+            if outermost:
+                conn.execute("BEGIN IMMEDIATE")
+            self._writer_depth += 1
+            try:
+                yield conn
+            except Exception:
+                self._writer_depth -= 1
+                if outermost and conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            else:
+                self._writer_depth -= 1
+                # executescript() commits on its own, so only COMMIT if still open
+                if outermost and conn.in_transaction:
+                    conn.execute("COMMIT")
+    
+    @contextmanager
+    def get_reader(self):
+        """
+        Context manager lending a read-only connection from the pool.
+        Opens connections lazily up to READER_POOL_SIZE, then waits for a free one.
+        """
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._readers_lock:
+                if self._readers_opened < READER_POOL_SIZE:
+                    self._readers_opened += 1
+                    conn = self._open_reader()
+                    self._all_readers.append(conn)
+            if conn is None:
+                conn = self._readers.get()
         try:
             yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
         finally:
-            conn.close()
+            self._readers.put(conn)
+    
+    def close_all(self):
+        """
+        Close the writer and every pooled reader (registered with atexit).
+        Readers go first so the writer's final checkpoint can fold the whole
+        WAL back into the database and truncate it to zero bytes.
+        """
+        with self._readers_lock:
+            readers, self._all_readers = self._all_readers, []
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        for conn in readers:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        if writer is None:
+            return
+        try:
+            writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            logger.warning("WAL checkpoint on shutdown failed: %s", e)
+        try:
+            writer.close()
+        except sqlite3.Error:
+            pass
     
     def init_db(self):
-        """Initialize database with schema from schema.sql file."""
+        """
+        Initialize database with schema from schema.sql file.
+        Opening the writer here also switches the file to WAL mode, so the
+        first request doesn't pay for creating the WAL file.
+        """
         if not os.path.exists(SCHEMA_FILE):
             raise FileNotFoundError(f"Schema file '{SCHEMA_FILE}' not found")
         
         with open(SCHEMA_FILE, 'r') as f:
             schema_sql = f.read()
         
-        with self.get_connection() as conn:
+        with self.get_writer() as conn:
             conn.executescript(schema_sql)
+            
+            # Older databases predate the notes column; event queries select it explicitly
+            columns = [info[1] for info in conn.execute("PRAGMA table_info(events)")]
+            if 'notes' not in columns:
+                conn.execute("ALTER TABLE events ADD COLUMN notes TEXT")
         
         print(f"✅ Database initialized: {self.db_path}")
     
+    def iter_all_events(self):
+        """
+        Yield all events as dictionaries, one row at a time.
+        Rows are converted as the cursor advances, so the full result set is never
+        held twice (SQLite rows + dicts). The reader connection stays borrowed
+        until the generator is exhausted or closed.
+        """
+        with self.get_reader() as conn:
+            for row in conn.execute(self._SQL_GET_ALL):
+                yield self._row_to_dict(row)
+    
     def get_all_events(self):
         """Retrieve all events from database as list of dictionaries."""
-        with self.get_connection() as conn:
-            cursor = conn.execute("SELECT * FROM events ORDER BY start_time")
-            rows = cursor.fetchall()
-            return [self._row_to_dict(row) for row in rows]
+        return list(self.iter_all_events())
     
     def get_future_events(self, from_date=None):
         """
@@ -66,52 +374,45 @@ class DatabaseManager:
         Returns:
             List of event dictionaries with end_time >= from_date
         """
-        if from_date is None:
-            from_date = datetime.now().isoformat()
-        
-        query = """
-            SELECT * FROM events 
-            WHERE end_time >= ?
-            ORDER BY start_time
-        """
-        with self.get_connection() as conn:
-            cursor = conn.execute(query, (from_date,))
+        with self.get_reader() as conn:
+            if from_date is None:
+                # SQLite supplies "now", the same clock check_conflicts uses
+                cursor = conn.execute(self._SQL_GET_FUTURE_FROM_NOW)
+            else:
+                cursor = conn.execute(self._SQL_GET_FUTURE, (from_date,))
             rows = cursor.fetchall()
             return [self._row_to_dict(row) for row in rows]
     
+    def get_events_version(self):
+        """
+        Return a token that changes whenever the events table changes.
+        Used as the ETag for GET /events so unchanged polls can answer 304.
+        
+        Reads the events_version counter, which triggers on the events table
+        bump inside every writing transaction - so writes from other worker
+        processes and several writes within one second all change the token.
+        """
+        with self.get_reader() as conn:
+            (version,) = conn.execute(self._SQL_EVENTS_VERSION).fetchone()
+        return str(version)
+    
     def get_event_by_id(self, event_id):
         """Retrieve a single event by ID."""
-        with self.get_connection() as conn:
-            cursor = conn.execute("SELECT * FROM events WHERE id = ?", (event_id,))
+        with self.get_reader() as conn:
+            cursor = conn.execute(self._SQL_GET_BY_ID, (event_id,))
             row = cursor.fetchone()
             return self._row_to_dict(row) if row else None
     
-    def create_event(self, event_dict):
-        """
-        Insert a new event into database.
-        Returns the created event with its new ID.
-        """
-        # Extract fields from event dictionary
-        fields = [
-            'title', 'priority', 'type', 'category', 'start_time', 'end_time', 'locked',
-            'parent_id', 'duration', 'frequency', 'earliest_start', 'deadline'
-        ]
-        
+    @staticmethod
+    def _event_values(event_dict):
+        """Build the INSERT parameter tuple (in _SQL_INSERT column order) for an event dict."""
         # Handle preferred_time: convert dict to JSON string if present
         preferred_time = event_dict.get('preferred_time')
         if preferred_time and isinstance(preferred_time, dict):
-            preferred_time = json.dumps(preferred_time)
-        
-        # Build SQL INSERT query
-        query = """
-            INSERT INTO events (
-                title, priority, type, category, start_time, end_time, locked,
-                parent_id, duration, frequency, earliest_start, deadline, preferred_time, notes
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
+            preferred_time = _encode_preferred(preferred_time)
         
         # Map field names: start/end → start_time/end_time for database
-        values = (
+        return (
             event_dict.get('title'),
             event_dict.get('priority'),
             event_dict.get('type'),
@@ -127,22 +428,61 @@ class DatabaseManager:
             preferred_time,
             event_dict.get('notes', '')  # Add notes field
         )
+    
+    def create_event(self, event_dict):
+        """
+        Insert a new event into database.
+        Returns the created event with its new ID.
+        """
+        values = self._event_values(event_dict)
         
-        with self.get_connection() as conn:
-            cursor = conn.execute(query, values)
+        if HAS_RETURNING:
+            # Insert and read back the stored row in one statement
+            with self.get_writer() as conn:
+                rows = conn.execute(self._SQL_INSERT_RETURNING, values).fetchall()
+            return self._row_to_dict(rows[0])
+        
+        with self.get_writer() as conn:
+            cursor = conn.execute(self._SQL_INSERT, values)
             event_id = cursor.lastrowid
         
         # Return the created event with its new ID
         return self.get_event_by_id(event_id)
     
+    def bulk_create_events(self, events):
+        """
+        Insert many events with one prepared statement in a single transaction.
+        All rows are inserted or none are.
+        
+        Args:
+            events: List of event dicts (same format as create_event)
+        
+        Returns:
+            List of created event dictionaries, in input order
+        """
+        if not events:
+            return []
+        
+        rows = [self._event_values(event) for event in events]
+        
+        with self.get_writer() as conn:
+            conn.executemany(self._SQL_INSERT, rows)
+            # The writer lock and BEGIN IMMEDIATE keep other inserts out, and
+            # AUTOINCREMENT hands out consecutive ids within the batch
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            first_id = last_id - len(rows) + 1
+            created = conn.execute(self._SQL_GET_ID_RANGE, (first_id, last_id)).fetchall()
+        
+        return [self._row_to_dict(row) for row in created]
+    
     def delete_event(self, event_id):
         """
         Delete an event by ID.
         Cascades to delete recurring instances due to foreign key constraint.
         Returns True if deleted, False if not found.
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute("DELETE FROM events WHERE id = ?", (event_id,))
+        with self.get_writer() as conn:
+            cursor = conn.execute(self._SQL_DELETE, (event_id,))
             return cursor.rowcount > 0
     
     def update_event(self, event_id, updates):
@@ -175,7 +515,7 @@ class DatabaseManager:
         
         query = f"UPDATE events SET {', '.join(set_clauses)} WHERE id = ?"
         
-        with self.get_connection() as conn:
+        with self.get_writer() as conn:
             cursor = conn.execute(query, values)
             return cursor.rowcount > 0
     
@@ -185,13 +525,14 @@ class DatabaseManager:
         Does NOT delete other instances.
         Returns True if deleted, False if not found.
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute("DELETE FROM events WHERE id = ?", (event_id,))
+        with self.get_writer() as conn:
+            cursor = conn.execute(self._SQL_DELETE, (event_id,))
             return cursor.rowcount > 0
     
     def delete_future_recurring_instances(self, event_id):
         """
         Delete this recurring instance and all future instances (same parent_id, later start time).
+        Instances without a parent_id are matched by title, duration and frequency.
         
         Args:
             event_id: ID of the recurring instance to delete from
@@ -199,79 +540,14 @@ class DatabaseManager:
         Returns:
             Number of instances deleted
         """
-        # First, get the event to find its parent_id and start_time (separate connection)
-        event = self.get_event_by_id(event_id)
-        print(f"  delete_future_recurring_instances: event_id={event_id}")
-        print(f"  Event retrieved: {event}")
-        
-        if not event or event['type'] != 'recurring_instance':
-            print(f"  ERROR: Event not found or not recurring_instance (type={event.get('type') if event else 'None'})")
-            return 0
-        
-        parent_id = event.get('parent_id')
-        start_time = event.get('start')  # _row_to_dict maps start_time → 'start'
-        
-        print(f"  parent_id={parent_id}, start_time={start_time}")
-        
-        if not start_time:
-            print(f"  ERROR: Missing start_time")
-            return 0
-        
-        # Now delete this instance and all future instances
-        with self.get_connection() as conn:
-            if parent_id:
-                # Standard case: instances have parent_id
-                # First, let's see what we're about to delete
-                test_cursor = conn.execute("""
-                    SELECT id, title, start_time FROM events 
-                    WHERE parent_id = ? 
-                    AND start_time >= ?
-                    AND type = 'recurring_instance'
-                """, (parent_id, start_time))
-                matching_events = test_cursor.fetchall()
-                print(f"  SQL query will match {len(matching_events)} events:")
-                for evt in matching_events:
-                    print(f"    - ID {evt['id']}: {evt['title']} at {evt['start_time']}")
-                
-                # Now actually delete them
-                cursor = conn.execute("""
-                    DELETE FROM events 
-                    WHERE parent_id = ? 
-                    AND start_time >= ?
-                    AND type = 'recurring_instance'
-                """, (parent_id, start_time))
-            else:
-                # Fallback: no parent_id, find by matching title, duration, frequency
-                print(f"  No parent_id - finding siblings by title/duration/frequency")
-                title = event.get('title')
-                duration = event.get('duration')
-                frequency = event.get('frequency')
-                
-                test_cursor = conn.execute("""
-                    SELECT id, title, start_time FROM events 
-                    WHERE title = ?
-                    AND duration = ?
-                    AND frequency = ?
-                    AND start_time >= ?
-                    AND type = 'recurring_instance'
-                """, (title, duration, frequency, start_time))
-                matching_events = test_cursor.fetchall()
-                print(f"  SQL query will match {len(matching_events)} events:")
-                for evt in matching_events:
-                    print(f"    - ID {evt['id']}: {evt['title']} at {evt['start_time']}")
-                
-                # Now actually delete them
-                cursor = conn.execute("""
-                    DELETE FROM events 
-                    WHERE title = ?
-                    AND duration = ?
-                    AND frequency = ?
-                    AND start_time >= ?
-                    AND type = 'recurring_instance'
-                """, (title, duration, frequency, start_time))
-            
-            deleted = cursor.rowcount
-            print(f"  Deleted {deleted} instances")
+        # One statement: the pivot event is looked up inside the DELETE itself
+        with self.get_writer() as conn:
+            # rowcount isn't reported for statements starting with WITH, and
+            # total_changes would also count the events_version trigger rows
+            conn.execute(self._SQL_DELETE_FUTURE_INSTANCES, (event_id,))
+            deleted = conn.execute("SELECT changes()").fetchone()[0]
+            logger.debug("delete_future_recurring_instances: event_id=%s deleted %d instances",
+                         event_id, deleted)
             return deleted
     
     def get_future_recurring_instances(self, event_id):
@@ -285,43 +561,9 @@ class DatabaseManager:
         Returns:
             List of event IDs
         """
-        # First, get the event to find its parent_id and start_time
-        event = self.get_event_by_id(event_id)
-        if not event or event['type'] != 'recurring_instance':
-            return []
-        
-        parent_id = event.get('parent_id')
-        start_time = event.get('start')
-        
-        if not start_time:
-            return []
-        
-        # Get all future instances with the same parent
-        with self.get_connection() as conn:
-            if parent_id:
-                # Standard case: instances have parent_id
-                cursor = conn.execute("""
-                    SELECT id FROM events 
-                    WHERE parent_id = ? 
-                    AND start_time >= ?
-                    AND type = 'recurring_instance'
-                """, (parent_id, start_time))
-            else:
-                # Fallback: no parent_id, find by matching title, duration, frequency
-                title = event.get('title')
-                duration = event.get('duration')
-                frequency = event.get('frequency')
-                
-                cursor = conn.execute("""
-                    SELECT id FROM events 
-                    WHERE title = ?
-                    AND duration = ?
-                    AND frequency = ?
-                    AND start_time >= ?
-                    AND type = 'recurring_instance'
-                """, (title, duration, frequency, start_time))
-            
-            return [row['id'] for row in cursor.fetchall()]
+        with self.get_reader() as conn:
+            cursor = conn.execute(self._SQL_GET_FUTURE_INSTANCES, (event_id,))
+            return [row[0] for row in cursor.fetchall()]
     
     def find_breaks_after_event(self, event_id):
         """
@@ -349,12 +591,8 @@ class DatabaseManager:
         Returns:
             True if updated, False if event not found
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                UPDATE events 
-                SET start_time = ?, end_time = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (start_time, end_time, event_id))
+        with self.get_writer() as conn:
+            cursor = conn.execute(self._SQL_UPDATE_TIMES, (start_time, end_time, event_id))
             return cursor.rowcount > 0
     
     def bulk_update_event_times(self, updates):
@@ -372,16 +610,13 @@ class DatabaseManager:
         if not updates:
             return 0
         
-        with self.get_connection() as conn:
-            count = 0
-            for update in updates:
-                cursor = conn.execute("""
-                    UPDATE events 
-                    SET start_time = ?, end_time = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (update['start'], update['end'], update['id']))
-                count += cursor.rowcount
-            return count
+        params = [(update['start'], update['end'], update['id']) for update in updates]
+        
+        with self.get_writer() as conn:
+            # One prepared statement for every row; rowcount sums changes()
+            # per row, which leaves out the events_version trigger updates
+            cursor = conn.executemany(self._SQL_UPDATE_TIMES, params)
+            return cursor.rowcount
     
     def get_events_in_range(self, start_date, end_date):
         """
@@ -395,14 +630,48 @@ class DatabaseManager:
         Returns:
             List of event dictionaries
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM events 
-                WHERE start_time < ? AND end_time > ?
-                ORDER BY start_time
-            """, (end_date, start_date))
+        with self.get_reader() as conn:
+            cursor = conn.execute(self._SQL_IN_RANGE, (end_date, start_date))
             return [self._row_to_dict(row) for row in cursor.fetchall()]
     
+    def get_events_starting_in_range(self, start_date, end_date):
+        """
+        Get events that START within a date range (unlike get_events_in_range,
+        events that began before start_date are excluded).
+        Used where an event must belong to exactly one week, e.g. optimization.
+        
+        Args:
+            start_date: ISO format datetime string (inclusive)
+            end_date: ISO format datetime string (inclusive)
+        
+        Returns:
+            List of event dictionaries starting within the date range
+        """
+        with self.get_reader() as conn:
+            cursor = conn.execute(self._SQL_STARTING_IN_RANGE, (start_date, end_date))
+            rows = cursor.fetchall()
+            return [self._row_to_dict(row) for row in rows]
+    
+    def get_category_stats(self, start_date, end_date):
+        """
+        Aggregate event count and minutes per category for events that START
+        within a date range (same window as get_events_starting_in_range).
+        The grouping runs in SQLite, so only one row per category comes back.
+        
+        Args:
+            start_date: ISO format datetime string (inclusive)
+            end_date: ISO format datetime string (inclusive)
+        
+        Returns:
+            Dictionary of category -> {'count': int, 'minutes': float}
+        """
+        with self.get_reader() as conn:
+            cursor = conn.execute(self._SQL_CATEGORY_STATS, (start_date, end_date))
+            return {
+                category: {'count': count, 'minutes': minutes or 0}
+                for category, count, minutes in cursor
+            }
+    
     def check_conflicts(self, start_time, end_time, exclude_id=None):
         """
         Check if a time slot conflicts with existing events.
@@ -417,110 +686,78 @@ class DatabaseManager:
         Returns:
             True if conflict exists, False if slot is free
         """
-        # Future-only optimization: only check events that end after now
-        query = """
-            SELECT COUNT(*) as count FROM events
-            WHERE start_time < ? 
-            AND end_time > ?
-            AND end_time >= datetime('now')
-        """
-        params = [end_time, start_time]
-        
         # Exclude specific event if updating
         if exclude_id is not None:
-            query += " AND id != ?"
-            params.append(exclude_id)
+            query = self._SQL_CHECK_CONFLICTS_EXCLUDING
+            params = (start_time, end_time, exclude_id)
+        else:
+            query = self._SQL_CHECK_CONFLICTS
+            params = (start_time, end_time)
         
-        with self.get_connection() as conn:
+        with self.get_reader() as conn:
             cursor = conn.execute(query, params)
-            result = cursor.fetchone()
-            return result['count'] > 0
+            return cursor.fetchone() is not None
     
     def toggle_lock(self, event_id):
         """
         Toggle the locked status of an event.
         Returns the updated event or None if not found.
         """
-        event = self.get_event_by_id(event_id)
-        if not event:
-            return None
-        
-        new_locked_status = 0 if event['locked'] else 1
+        # The toggle is a server-side expression, so no read is needed first
+        if HAS_RETURNING:
+            with self.get_writer() as conn:
+                rows = conn.execute(self._SQL_TOGGLE_LOCK_RETURNING, (event_id,)).fetchall()
+            return self._row_to_dict(rows[0]) if rows else None
         
-        with self.get_connection() as conn:
-            conn.execute(
-                "UPDATE events SET locked = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                (new_locked_status, event_id)
-            )
+        with self.get_writer() as conn:
+            if conn.execute(self._SQL_TOGGLE_LOCK, (event_id,)).rowcount == 0:
+                return None
         
         return self.get_event_by_id(event_id)
     
     def _row_to_dict(self, row):
         """
-        Convert SQLite Row object to dictionary matching app.py's event format.
+        Convert a raw event row (selected with EVENT_COLUMNS) to a dictionary
+        matching app.py's event format.
         Maps database field names back to app field names.
         """
         if not row:
             return None
         
+        # Positional unpack is much cheaper than a by-name lookup per column
+        (id_, title, priority, type_, category, start_time, end_time, locked,
+         parent_id, duration, frequency, earliest_start, deadline,
+         preferred_time, notes) = row
+        
         event = {
-            'id': row['id'],
-            'title': row['title'],
-            'priority': row['priority'],
-            'type': row['type'],
-            'category': row['category'],  # Add category field
-            'start': row['start_time'],  # Map back from start_time → start
-            'end': row['end_time'],      # Map back from end_time → end
-            'locked': bool(row['locked'])
+            'id': id_,
+            'title': title,
+            'priority': priority,
+            'type': type_,
+            'category': category,
+            'start': start_time,  # Map back from start_time → start
+            'end': end_time,      # Map back from end_time → end
+            'locked': bool(locked),
+            'notes': notes if notes is not None else ''
         }
         
-        # Add notes field safely (handle if column doesn't exist yet)
-        try:
-            event['notes'] = row['notes'] if row['notes'] is not None else ''
-        except (KeyError, IndexError):
-            event['notes'] = ''
-        
         # Add optional fields only if they're not NULL
-        if row['parent_id'] is not None:
-            event['parent_id'] = row['parent_id']
-        if row['duration'] is not None:
-            event['duration'] = row['duration']
-        if row['frequency'] is not None:
-            event['frequency'] = row['frequency']
-        if row['earliest_start'] is not None:
-            event['earliest_start'] = row['earliest_start']
-        if row['deadline'] is not None:
-            event['deadline'] = row['deadline']
-        if row['preferred_time'] is not None:
-            # Parse JSON string back to dict
-            try:
-                event['preferred_time'] = json.loads(row['preferred_time'])
-            except json.JSONDecodeError:
-                event['preferred_time'] = {}
+        if parent_id is not None:
+            event['parent_id'] = parent_id
+        if duration is not None:
+            event['duration'] = duration
+        if frequency is not None:
+            event['frequency'] = frequency
+        if earliest_start is not None:
+            event['earliest_start'] = earliest_start
+        if deadline is not None:
+            event['deadline'] = deadline
+        if preferred_time is not None:
+            # Parse JSON string back to dict; copy so callers can't mutate the cached value
+            event['preferred_time'] = dict(_decode_preferred(preferred_time))
         
         return event
     
-    def get_events_in_range(self, start_date, end_date):
-        """
-        Get events within a specific date range for health score analysis.
-        
-        Args:
-            start_date: ISO format datetime string (inclusive)
-            end_date: ISO format datetime string (inclusive)
-        
-        Returns:
-            List of event dictionaries within the date range
-        """
-        query = """
-            SELECT * FROM events 
-            WHERE start_time >= ? AND start_time <= ?
-            ORDER BY start_time
-        """
-        with self.get_connection() as conn:
-            cursor = conn.execute(query, (start_date, end_date))
-            rows = cursor.fetchall()
-            return [self._row_to_dict(row) for row in rows]
-    
     def get_user_preferences(self, user_id=1):
         """
         Get user preferences for smart scheduling.
@@ -528,11 +765,8 @@ class DatabaseManager:
         Returns:
             Dictionary with sleep hours, work hours, and scheduling preferences
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM user_preferences WHERE user_id = ?",
-                (user_id,)
-            )
+        with self.get_reader() as conn:
+            cursor = conn.execute(self._SQL_GET_PREFERENCES, (user_id,))
             row = cursor.fetchone()
             
             if not row:
@@ -545,12 +779,13 @@ class DatabaseManager:
                     'round_to_minutes': 5
                 }
             
+            sleep_start, sleep_end, work_start, work_end, round_to_minutes = row
             return {
-                'sleep_start': row['sleep_start'],
-                'sleep_end': row['sleep_end'],
-                'work_start': row['work_start'],
-                'work_end': row['work_end'],
-                'round_to_minutes': row['round_to_minutes']
+                'sleep_start': sleep_start,
+                'sleep_end': sleep_end,
+                'work_start': work_start,
+                'work_end': work_end,
+                'round_to_minutes': round_to_minutes
             }
     
     def update_user_preferences(self, preferences, user_id=1):
@@ -564,17 +799,8 @@ class DatabaseManager:
         Returns:
             Updated preferences dictionary
         """
-        with self.get_connection() as conn:
-            conn.execute("""
-                UPDATE user_preferences 
-                SET sleep_start = ?,
-                    sleep_end = ?,
-                    work_start = ?,
-                    work_end = ?,
-                    round_to_minutes = ?,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE user_id = ?
-            """, (
+        with self.get_writer() as conn:
+            conn.execute(self._SQL_UPDATE_PREFERENCES, (
                 preferences.get('sleep_start', '23:00'),
                 preferences.get('sleep_end', '07:00'),
                 preferences.get('work_start', '09:00'),
@@ -4,8 +4,43 @@ Provides real-time validation for event creation and editing.
 Detects conflicts, violations, and provides helpful warnings.
 """
 
-from datetime import datetime, time, timedelta
-from typing import List, Dict, Optional
+import heapq
+import sys
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+
+from interval_tree import IntervalTree
+
+# datetime.fromisoformat() accepts a trailing 'Z' natively from Python 3.11
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+# Times are compared as whole seconds since these epochs (naive vs aware datetimes)
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_SECOND = timedelta(seconds=1)
+
+# Margin around an event's week when loading its context from the database;
+# covers the 30-minute neighbour checks and zero-length events at the edges
+_CONTEXT_MARGIN = timedelta(days=1)
+
+# Parsed existing-event timestamps kept across validators (one per request)
+_TIMESTAMP_CACHE_SIZE = 8192
+
+# Check thresholds in seconds
+_FIFTEEN_MIN = 15 * 60
+_THIRTY_MIN = 30 * 60
+_DEEP_WORK_MIN = 90 * 60
+
+# Categories are interned to small int codes so the checks compare ints, and
+# "is this work?" is one bit test against _WORK_MASK. Categories outside this
+# table get fresh codes per validator (see _category_code).
+_CAT_WORK = 1
+_CAT_MEETING = 2
+_CATEGORY_CODES = {'Work': _CAT_WORK, 'Meeting': _CAT_MEETING, 'Personal': 3, 'Recreational': 4, 'Meal': 5}
+_WORK_MASK = (1 << _CAT_WORK) | (1 << _CAT_MEETING)
 
 
 class EventValidator:
@@ -26,6 +61,53 @@ class EventValidator:
         """
         self.existing_events = existing_events
         self.preferences = preferences
+        self._category_codes = dict(_CATEGORY_CODES)
+        
+        # Parse every existing event once; the checks below read these instead
+        # of re-parsing the same ISO strings on each pass
+        self._events = [self._prepare_event(event) for event in existing_events]
+        
+        # Sorted by start (stable, so schedule order is kept for equal starts) so the
+        # time-window checks can bisect to their candidates instead of scanning
+        self._events.sort(key=lambda e: e['start_ts'])
+        self._start_keys = [e['start_ts'] for e in self._events]
+        self._ends_by_start = [e['end_ts'] for e in self._events]
+        
+        # Also sorted by end (equal ends stay in start order) for the
+        # "latest event ending before" lookup
+        self._events_by_end = sorted(self._events, key=lambda e: e['end_ts'])
+        self._end_keys = [e['end_ts'] for e in self._events_by_end]
+        self._max_duration = max(
+            (e['end_ts'] - e['start_ts'] for e in self._events), default=0
+        )
+        
+        # Overlap queries go through an interval tree: O(log N + k) per lookup
+        self._tree = IntervalTree((e['start_ts'], e['end_ts'], e) for e in self._events)
+        
+        # Per-day and per-week indexes (keyed by start date) with running minute
+        # totals, so the same-day and same-week checks don't scan the schedule
+        self._minutes_by_week = defaultdict(float)
+        self._week_minutes_by_id = {}
+        self._work_meeting_by_day = defaultdict(list)
+        self._meetings_by_day = defaultdict(list)
+        self._work_minutes_by_day = defaultdict(float)
+        self._meeting_minutes_by_day = defaultdict(float)
+        for event in self._events:
+            # Scheduled minutes per week (keyed by the Monday of the start date)
+            day = event['start'].date()
+            week = self._week_of(day)
+            self._minutes_by_week[week] += event['minutes']
+            if event['id'] is not None:
+                self._week_minutes_by_id[event['id']] = (week, event['minutes'])
+            
+            cat_code = event['cat_code']
+            if not (1 << cat_code) & _WORK_MASK:
+                continue
+            self._work_meeting_by_day[day].append(event)
+            self._work_minutes_by_day[day] += event['minutes']
+            if cat_code == _CAT_MEETING:
+                self._meetings_by_day[day].append(event)
+                self._meeting_minutes_by_day[day] += event['minutes']
         
         # Extract preference values with defaults
         self.sleep_start = self._parse_time(preferences.get('sleep_start', '23:00'))
@@ -34,14 +116,25 @@ class EventValidator:
         self.work_end = self._parse_time(preferences.get('work_end', '18:00'))
         self.max_work_hours = preferences.get('max_work_hours_per_day', 10)
         self.min_break_interval = preferences.get('min_break_interval_minutes', 120)
+        
+        # The same boundaries as seconds since midnight, for plain int comparisons
+        self._sleep_start_sod = self._seconds_of_day(self.sleep_start)
+        self._sleep_end_sod = self._seconds_of_day(self.sleep_end)
+        self._sleep_crosses_midnight = self._sleep_start_sod > self._sleep_end_sod
+        self._work_start_sod = self._seconds_of_day(self.work_start)
+        self._work_end_sod = self._seconds_of_day(self.work_end)
+        self._daily_work_hours = (self._work_end_sod - self._work_start_sod) / 3600
     
-    def validate_event(self, event: Dict, event_id: Optional[int] = None) -> Dict:
+    def validate_event(self, event: Dict, event_id: Optional[int] = None, mode: str = 'full') -> Dict:
         """
         Validate an event and return validation results.
         
         Args:
             event: Event data to validate (must have start, end, title, category)
             event_id: ID of event being edited (None for new events)
+            mode: 'full' runs every check. 'fast' runs only the blocking checks
+                  (time format, duration, overlaps) for "can I save this?" callers;
+                  warnings and suggestions are only populated in 'full'.
         
         Returns:
             {
@@ -75,7 +168,9 @@ class EventValidator:
                 'severity': self.ERROR
             })
         
-        duration_minutes = (end - start).total_seconds() / 60
+        start_ts = self._to_seconds(start)
+        end_ts = self._to_seconds(end)
+        duration_minutes = (end_ts - start_ts) / 60
         
         # Check for extremely short events
         if duration_minutes < 5:
@@ -94,7 +189,7 @@ class EventValidator:
             })
         
         # Check for overlapping events
-        overlaps = self._check_overlaps(start, end, event_id)
+        overlaps = self._check_overlaps(start_ts, end_ts, event_id)
         if overlaps:
             for overlap in overlaps:
                 errors.append({
@@ -104,8 +199,18 @@ class EventValidator:
                     'conflicting_event': overlap
                 })
         
+        if mode == 'fast':
+            return {
+                'valid': len(errors) == 0,
+                'errors': errors,
+                'warnings': [],
+                'suggestions': []
+            }
+        
         # Check sleep hour conflicts
-        sleep_conflict = self._check_sleep_conflict(start, end)
+        start_sod = self._seconds_of_day(start)
+        end_sod = self._seconds_of_day(end)
+        sleep_conflict = self._check_sleep_conflict(start_sod, end_sod)
         if sleep_conflict:
             warnings.append({
                 'type': 'sleep_conflict',
@@ -115,10 +220,11 @@ class EventValidator:
         
         # Category-specific validations
         category = event.get('category', 'Personal')
+        cat_code = self._category_code(category)
         
-        if category in ['Work', 'Meeting']:
+        if (1 << cat_code) & _WORK_MASK:
             # Check if work event is outside work hours
-            if not self._is_during_work_hours(start, end):
+            if not self._is_during_work_hours(start_sod, end_sod):
                 suggestions.append({
                     'type': 'outside_work_hours',
                     'message': f'Work event scheduled outside typical work hours ({self.work_start.strftime("%H:%M")} - {self.work_end.strftime("%H:%M")})',
@@ -153,21 +259,11 @@ class EventValidator:
             })
         
         # Additional proactive checks from Feature 2
-        if category == 'Meeting':
-            meeting_load_warnings = self._check_meeting_load(start, end, duration_minutes, event_id)
-            warnings.extend(meeting_load_warnings)
-        
-        context_switch_suggestions = self._check_context_switches(start, end, category, event_id)
-        suggestions.extend(context_switch_suggestions)
-        
-        fragmentation_suggestions = self._check_fragmentation(start, end, event_id)
-        suggestions.extend(fragmentation_suggestions)
-        
-        buffer_warnings = self._check_planning_buffer(start, end, duration_minutes, event_id)
-        warnings.extend(buffer_warnings)
-        
-        deep_work_warnings = self._check_deep_work_disruption(start, end, event_id)
-        warnings.extend(deep_work_warnings)
+        proactive_warnings, proactive_suggestions = self._run_checks(
+            start, start_ts, end_ts, duration_minutes, category, cat_code, event_id
+        )
+        warnings.extend(proactive_warnings)
+        suggestions.extend(proactive_suggestions)
         
         # Determine overall validity
         valid = len(errors) == 0
@@ -179,144 +275,281 @@ class EventValidator:
             'suggestions': suggestions
         }
     
-    def _check_meeting_load(self, start: datetime, end: datetime, duration_minutes: float, exclude_id: Optional[int] = None) -> List[Dict]:
+    def validate_event_quick(self, event: Dict, event_id: Optional[int] = None) -> bool:
+        """
+        Whether validate_event would report the event as valid. Runs just the
+        blocking checks (time format, duration, overlaps) and builds no messages.
+        No route calls this yet - it is an API for in-process callers that only
+        need a yes/no. /validate-event's mode='fast' is the HTTP equivalent.
+        
+        Args:
+            event: Event data to validate (must have start and end)
+            event_id: ID of event being edited (None for new events)
+        """
+        try:
+            start = self._parse_iso(event['start'])
+            end = self._parse_iso(event['end'])
+        except (ValueError, KeyError):
+            return False
+        
+        if end <= start:
+            return False
+        
+        for overlap in self._tree.query(self._to_seconds(start), self._to_seconds(end)):
+            if not (event_id and overlap['id'] == event_id):
+                return False
+        
+        return True
+    
+    @classmethod
+    def context_range(cls, event: Dict) -> Optional[Tuple[str, str]]:
+        """
+        Time range covering every existing event validate_event can consult for
+        this event: overlaps, 30-minute neighbours, same day and same week.
+        Callers can load just this slice of the schedule with an indexed range
+        query (db.get_events_in_range) instead of the whole event table.
+        
+        Args:
+            event: Event data with start and end
+        
+        Returns:
+            (range_start, range_end) as ISO strings, or None if the times don't parse
+        """
+        try:
+            start = cls._parse_iso(event['start'])
+            end = cls._parse_iso(event['end'])
+        except (ValueError, KeyError):
+            return None
+        
+        week_start = datetime.combine(cls._week_of(start.date()), time.min, tzinfo=start.tzinfo)
+        week_end = week_start + timedelta(days=7)
+        range_start = min(week_start, start, end) - _CONTEXT_MARGIN
+        range_end = max(week_end, start, end) + _CONTEXT_MARGIN
+        return range_start.isoformat(), range_end.isoformat()
+    
+    def validate_events_batch(self, events: List[Dict]) -> List[Dict]:
+        """
+        Validate many new events at once (e.g. a calendar import).
+        The schedule indexes are built once for the whole batch, and the batch
+        is also checked against itself with a sorted sweep, so two imported
+        events that overlap each other are reported too.
+        
+        Args:
+            events: New events to validate (same format as validate_event)
+        
+        Returns:
+            List of validation results (same format as validate_event), in input order
+        """
+        results = [self.validate_event(event) for event in events]
+        
+        # Valid spans as (start, end, index), sorted by start
+        spans = []
+        for index, event in enumerate(events):
+            try:
+                start_ts = self._to_seconds(self._parse_iso(event['start']))
+                end_ts = self._to_seconds(self._parse_iso(event['end']))
+            except (ValueError, KeyError):
+                continue  # Already reported as invalid_time
+            if end_ts > start_ts:
+                spans.append((start_ts, end_ts, index))
+        spans.sort()
+        
+        # Sweep: a heap of (end, index) holds the events still running; after
+        # dropping those that ended, everything left overlaps the current event
+        active = []
+        for start_ts, end_ts, index in spans:
+            while active and active[0][0] <= start_ts:
+                heapq.heappop(active)
+            for _, other in active:
+                self._add_batch_overlap(results[index], events[other], other)
+                self._add_batch_overlap(results[other], events[index], index)
+            heapq.heappush(active, (end_ts, index))
+        
+        return results
+    
+    def _add_batch_overlap(self, result: Dict, other: Dict, other_index: int) -> None:
+        """Record that an event overlaps another event from the same batch."""
+        result['errors'].append({
+            'type': 'batch_overlap',
+            'message': f'Overlaps with "{other.get("title")}" from the same batch',
+            'severity': self.ERROR,
+            'batch_index': other_index
+        })
+        result['valid'] = False
+    
+    def _check_meeting_load(self, start: datetime, duration_minutes: float, exclude_id: Optional[int] = None) -> List[Dict]:
         """Check if adding this meeting creates excessive meeting load (>30% of work time)."""
         warnings = []
         event_day = start.date()
         
-        # Count meetings on the same day
-        same_day_meetings = []
-        for event in self.existing_events:
-            if exclude_id and event.get('id') == exclude_id:
-                continue
-            if event.get('category') == 'Meeting':
-                event_start = self._parse_iso(event['start'])
-                if event_start.date() == event_day:
-                    same_day_meetings.append(event)
-        
-        # Calculate total meeting time
-        total_meeting_mins = sum(
-            (self._parse_iso(e['end']) - self._parse_iso(e['start'])).total_seconds() / 60
-            for e in same_day_meetings
-        )
+        # Count meetings on the same day and their total time
+        meeting_count = len(self._meetings_by_day.get(event_day, ()))
+        total_meeting_mins = self._meeting_minutes_by_day.get(event_day, 0)
+        if exclude_id:
+            for event in self._meetings_by_day.get(event_day, ()):
+                if event['id'] == exclude_id:
+                    meeting_count -= 1
+                    total_meeting_mins -= event['minutes']
         total_meeting_mins += duration_minutes
         
-        # Calculate work hours for the day
-        work_hours = (datetime.combine(event_day, self.work_end) - 
-                     datetime.combine(event_day, self.work_start)).total_seconds() / 3600
-        
-        meeting_percentage = (total_meeting_mins / 60) / work_hours * 100
+        meeting_percentage = (total_meeting_mins / 60) / self._daily_work_hours * 100
         
         if meeting_percentage > 30:
             warnings.append({
                 'type': 'meeting_load',
-                'message': f'Meeting #{len(same_day_meetings) + 1} today ({int(meeting_percentage)}% of work time). Optimal: <30%',
+                'message': f'Meeting #{meeting_count + 1} today ({int(meeting_percentage)}% of work time). Optimal: <30%',
                 'severity': self.WARNING
             })
         
         return warnings
     
-    def _check_context_switches(self, start: datetime, end: datetime, category: str, exclude_id: Optional[int] = None) -> List[Dict]:
-        """Check if event creates context switches between different categories."""
-        suggestions = []
+    def _run_checks(self, start: datetime, start_ts: int, end_ts: int, duration_minutes: float,
+                    category: str, cat_code: int,
+                    exclude_id: Optional[int] = None) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Run the proactive checks (meeting load, context switches, fragmentation,
+        planning buffer, deep work disruption) in one pass over nearby events.
         
-        # Find adjacent events
-        adjacent_before = None
-        adjacent_after = None
+        Meeting load and planning buffer come from the per-day/per-week indexes.
+        The context-switch neighbours are bisected from the start and end orders.
+        Fragmentation and deep work only look at events within 15 minutes of the
+        new one, so a single loop over that window classifies each neighbour once.
+        Fragmentation reports at most one gap on each side (the closest).
+        
+        Returns:
+            (warnings, suggestions) in the same order as the separate checks
+        """
+        warnings = []
+        suggestions = []
         
-        for event in self.existing_events:
-            if exclude_id and event.get('id') == exclude_id:
+        if cat_code == _CAT_MEETING:
+            warnings.extend(self._check_meeting_load(start, duration_minutes, exclude_id))
+        warnings.extend(self._check_planning_buffer(start, duration_minutes, exclude_id))
+        
+        # Context switches: nearest neighbours within 30 min
+        adjacent_before = self._adjacent_before(start_ts, exclude_id)
+        adjacent_after = self._adjacent_after(end_ts, exclude_id)
+        
+        gap_before_event = None   # Closest event ending 0-15 min before (fragmentation)
+        gap_after_event = None    # Closest event starting 0-15 min after (fragmentation)
+        deep_work = []
+        
+        # The window is scanned over the parallel int arrays; an event's dict is
+        # only touched once it is known to sit within 15 min of the new event
+        events = self._events
+        starts = self._start_keys
+        ends = self._ends_by_start
+        lo = min(start_ts, end_ts) - _FIFTEEN_MIN - self._max_duration
+        hi = max(start_ts, end_ts) + _FIFTEEN_MIN
+        for i in range(bisect_left(starts, lo), bisect_right(starts, hi)):
+            event_start_ts = starts[i]
+            event_end_ts = ends[i]
+            gap_before = start_ts - event_end_ts    # Existing event ends before the new one
+            gap_after = event_start_ts - end_ts     # Existing event starts after the new one
+            if not (0 <= gap_before < _FIFTEEN_MIN or 0 <= gap_after < _FIFTEEN_MIN):
                 continue
             
-            event_start = self._parse_iso(event['start'])
-            event_end = self._parse_iso(event['end'])
+            event = events[i]
+            if exclude_id and event['id'] == exclude_id:
+                continue
             
-            # Event right before (within 30 min)
-            if event_end <= start and (start - event_end).total_seconds() / 60 <= 30:
-                if not adjacent_before or event_end > self._parse_iso(adjacent_before['end']):
-                    adjacent_before = event
+            # Fragmentation: small gaps (<15 min) that waste time; only the
+            # closest neighbour on each side is reported
+            if 0 < gap_before < _FIFTEEN_MIN:
+                if not gap_before_event or event_end_ts > gap_before_event['end_ts']:
+                    gap_before_event = event
+            if 0 < gap_after < _FIFTEEN_MIN:
+                if not gap_after_event or event_start_ts < gap_after_event['start_ts']:
+                    gap_after_event = event
             
-            # Event right after (within 30 min)
-            if event_start >= end and (event_start - end).total_seconds() / 60 <= 30:
-                if not adjacent_after or event_start < self._parse_iso(adjacent_after['start']):
-                    adjacent_after = event
+            # Deep work disruption: within 15 min of a 90+ min Work block
+            if event['cat_code'] == _CAT_WORK and event_end_ts - event_start_ts >= _DEEP_WORK_MIN:
+                if 0 <= gap_after < _FIFTEEN_MIN:
+                    deep_work.append({
+                        'type': 'deep_work_disruption',
+                        'message': f'Too close to deep work block "{event["title"]}". Leave 15+ min buffer',
+                        'severity': self.WARNING
+                    })
+                if 0 <= gap_before < _FIFTEEN_MIN:
+                    deep_work.append({
+                        'type': 'deep_work_disruption',
+                        'message': f'Too close after deep work block "{event["title"]}". Leave buffer time',
+                        'severity': self.WARNING
+                    })
         
-        # Check for context switches
-        if adjacent_before and adjacent_before.get('category') != category:
+        if adjacent_before and adjacent_before['cat_code'] != cat_code:
             suggestions.append({
                 'type': 'context_switch',
-                'message': f'Context switch from {adjacent_before.get("category")} to {category}',
+                'message': f'Context switch from {adjacent_before["category"]} to {category}',
                 'severity': self.INFO
             })
-        
-        if adjacent_after and adjacent_after.get('category') != category:
+        if adjacent_after and adjacent_after['cat_code'] != cat_code:
             suggestions.append({
                 'type': 'context_switch',
-                'message': f'Context switch from {category} to {adjacent_after.get("category")}',
+                'message': f'Context switch from {category} to {adjacent_after["category"]}',
+                'severity': self.INFO
+            })
+        if gap_before_event:
+            gap_minutes = (start_ts - gap_before_event['end_ts']) // 60
+            suggestions.append({
+                'type': 'fragmentation',
+                'message': f'{gap_minutes} min gap after "{gap_before_event["title"]}". Consider starting at {gap_before_event["end"].strftime("%H:%M")}',
+                'severity': self.INFO
+            })
+        if gap_after_event:
+            gap_minutes = (gap_after_event['start_ts'] - end_ts) // 60
+            suggestions.append({
+                'type': 'fragmentation',
+                'message': f'{gap_minutes} min gap before "{gap_after_event["title"]}". Consider ending at {gap_after_event["start"].strftime("%H:%M")}',
                 'severity': self.INFO
             })
+        warnings.extend(deep_work)
         
-        return suggestions
+        return warnings, suggestions
     
-    def _check_fragmentation(self, start: datetime, end: datetime, exclude_id: Optional[int] = None) -> List[Dict]:
-        """Check if event creates small gaps (<15 min) that waste time."""
-        suggestions = []
-        
-        for event in self.existing_events:
-            if exclude_id and event.get('id') == exclude_id:
-                continue
-            
-            event_start = self._parse_iso(event['start'])
-            event_end = self._parse_iso(event['end'])
-            
-            # Check gap before new event
-            if event_end < start:
-                gap_minutes = (start - event_end).total_seconds() / 60
-                if 0 < gap_minutes < 15:
-                    suggestions.append({
-                        'type': 'fragmentation',
-                        'message': f'{int(gap_minutes)} min gap after "{event.get("title")}". Consider starting at {event_end.strftime("%H:%M")}',
-                        'severity': self.INFO
-                    })
-            
-            # Check gap after new event
-            if event_start > end:
-                gap_minutes = (event_start - end).total_seconds() / 60
-                if 0 < gap_minutes < 15:
-                    suggestions.append({
-                        'type': 'fragmentation',
-                        'message': f'{int(gap_minutes)} min gap before "{event.get("title")}". Consider ending at {event_start.strftime("%H:%M")}',
-                        'severity': self.INFO
-                    })
-        
-        return suggestions
+    def _adjacent_before(self, start_ts: int, exclude_id: Optional[int] = None) -> Optional[Dict]:
+        """Latest-ending event that ends within 30 min before start_ts (first in start order on ties)."""
+        end_keys = self._end_keys
+        i = bisect_right(end_keys, start_ts)
+        while i > 0:
+            end_ts = end_keys[i - 1]
+            if start_ts - end_ts > _THIRTY_MIN:
+                break
+            # Events sharing this end time: the earliest-starting one not excluded
+            first = bisect_left(end_keys, end_ts, 0, i)
+            for event in self._events_by_end[first:i]:
+                if not (exclude_id and event['id'] == exclude_id):
+                    return event
+            i = first
+        return None
     
-    def _check_planning_buffer(self, start: datetime, end: datetime, duration_minutes: float, exclude_id: Optional[int] = None) -> List[Dict]:
+    def _adjacent_after(self, end_ts: int, exclude_id: Optional[int] = None) -> Optional[Dict]:
+        """Earliest-starting event that starts within 30 min after end_ts."""
+        events = self._events
+        for i in range(bisect_left(self._start_keys, end_ts), len(events)):
+            event = events[i]
+            if event['start_ts'] - end_ts > _THIRTY_MIN:
+                break
+            if not (exclude_id and event['id'] == exclude_id):
+                return event
+        return None
+    
+    def _check_planning_buffer(self, start: datetime, duration_minutes: float, exclude_id: Optional[int] = None) -> List[Dict]:
         """Check if adding event reduces planning buffer below healthy level (<5%)."""
         warnings = []
         
-        # Get week boundaries
-        week_start = start - timedelta(days=start.weekday())
-        week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_end = week_start + timedelta(days=7)
-        
-        # Calculate total scheduled time
-        total_minutes = 0
-        for event in self.existing_events:
-            if exclude_id and event.get('id') == exclude_id:
-                continue
-            
-            event_start = self._parse_iso(event['start'])
-            if week_start <= event_start < week_end:
-                event_end = self._parse_iso(event['end'])
-                total_minutes += (event_end - event_start).total_seconds() / 60
+        # Total scheduled time for the week, minus the event being edited
+        week = self._week_of(start.date())
+        total_minutes = self._minutes_by_week.get(week, 0)
+        if exclude_id and exclude_id in self._week_minutes_by_id:
+            excluded_week, excluded_minutes = self._week_minutes_by_id[exclude_id]
+            if excluded_week == week:
+                total_minutes -= excluded_minutes
         
         total_minutes += duration_minutes
         
         # Calculate available time
-        daily_work_hours = (datetime.combine(start.date(), self.work_end) -
-                          datetime.combine(start.date(), self.work_start)).total_seconds() / 3600
-        available_minutes = 7 * daily_work_hours * 60
+        available_minutes = 7 * self._daily_work_hours * 60
         
         slack_percent = ((available_minutes - total_minutes) / available_minutes) * 100
         
@@ -329,107 +562,118 @@ class EventValidator:
         
         return warnings
     
-    def _check_deep_work_disruption(self, start: datetime, end: datetime, exclude_id: Optional[int] = None) -> List[Dict]:
-        """Check if event disrupts existing deep work blocks (90+ min)."""
-        warnings = []
-        
-        # Find work blocks of 90+ minutes
-        for event in self.existing_events:
-            if exclude_id and event.get('id') == exclude_id:
-                continue
-            
-            if event.get('category') != 'Work':
-                continue
-            
-            event_start = self._parse_iso(event['start'])
-            event_end = self._parse_iso(event['end'])
-            duration = (event_end - event_start).total_seconds() / 60
-            
-            if duration < 90:
-                continue
-            
-            # Check if new event is too close (within 15 min)
-            if end <= event_start and (event_start - end).total_seconds() / 60 < 15:
-                warnings.append({
-                    'type': 'deep_work_disruption',
-                    'message': f'Too close to deep work block "{event.get("title")}". Leave 15+ min buffer',
-                    'severity': self.WARNING
-                })
-            
-            if start >= event_end and (start - event_end).total_seconds() / 60 < 15:
-                warnings.append({
-                    'type': 'deep_work_disruption',
-                    'message': f'Too close after deep work block "{event.get("title")}". Leave buffer time',
-                    'severity': self.WARNING
-                })
-        
-        return warnings
-    
-    def _check_overlaps(self, start: datetime, end: datetime, exclude_id: Optional[int] = None) -> List[Dict]:
+    def _check_overlaps(self, start_ts: int, end_ts: int, exclude_id: Optional[int] = None) -> List[Dict]:
         """Find events that overlap with the given time range."""
         overlaps = []
         
-        for event in self.existing_events:
+        # The tree only returns events with start < end_ts and end > start_ts
+        for event in self._tree.query(start_ts, end_ts):
             # Skip the event being edited
-            if exclude_id and event.get('id') == exclude_id:
+            if exclude_id and event['id'] == exclude_id:
                 continue
             
-            event_start = self._parse_iso(event['start'])
-            event_end = self._parse_iso(event['end'])
-            
-            # Check for overlap
-            if start < event_end and end > event_start:
-                overlaps.append({
-                    'id': event.get('id'),
-                    'title': event.get('title'),
-                    'start': event_start.strftime('%Y-%m-%d %H:%M'),
-                    'end': event_end.strftime('%Y-%m-%d %H:%M'),
-                    'category': event.get('category')
-                })
+            overlaps.append({
+                'id': event['id'],
+                'title': event['title'],
+                'start': event['start'].strftime('%Y-%m-%d %H:%M'),
+                'end': event['end'].strftime('%Y-%m-%d %H:%M'),
+                'category': event['category']
+            })
         
         return overlaps
     
-    def _check_sleep_conflict(self, start: datetime, end: datetime) -> bool:
-        """Check if event occurs during sleep hours."""
+    def _check_sleep_conflict(self, start_sod: int, end_sod: int) -> bool:
+        """Check if event occurs during sleep hours (times as seconds since midnight)."""
+        sleep_start = self._sleep_start_sod
+        sleep_end = self._sleep_end_sod
+        
         # Handle sleep period that crosses midnight
-        if self.sleep_start > self.sleep_end:
+        if self._sleep_crosses_midnight:
             # Sleep period crosses midnight (e.g., 23:00 - 07:00)
-            return (start.time() >= self.sleep_start or start.time() < self.sleep_end or
-                    end.time() >= self.sleep_start or end.time() < self.sleep_end)
+            return (start_sod >= sleep_start or start_sod < sleep_end or
+                    end_sod >= sleep_start or end_sod < sleep_end)
         else:
             # Sleep period within same day
-            return (self.sleep_start <= start.time() < self.sleep_end or
-                    self.sleep_start < end.time() <= self.sleep_end)
+            return (sleep_start <= start_sod < sleep_end or
+                    sleep_start < end_sod <= sleep_end)
     
-    def _is_during_work_hours(self, start: datetime, end: datetime) -> bool:
-        """Check if event is during typical work hours."""
+    def _is_during_work_hours(self, start_sod: int, end_sod: int) -> bool:
+        """Check if event is during typical work hours (times as seconds since midnight)."""
         # Event is during work hours if it starts and ends within work hours
-        return (self.work_start <= start.time() < self.work_end and
-                self.work_start < end.time() <= self.work_end)
+        return (self._work_start_sod <= start_sod < self._work_end_sod and
+                self._work_start_sod < end_sod <= self._work_end_sod)
     
     def _calculate_day_work_time(self, date, exclude_id: Optional[int] = None) -> float:
         """Calculate total work time (in minutes) for a specific day."""
-        total_minutes = 0
+        total_minutes = self._work_minutes_by_day.get(date, 0)
         
-        for event in self.existing_events:
-            if exclude_id and event.get('id') == exclude_id:
-                continue
-            
-            if event.get('category') not in ['Work', 'Meeting']:
-                continue
-            
-            event_start = self._parse_iso(event['start'])
-            if event_start.date() == date:
-                event_end = self._parse_iso(event['end'])
-                duration = (event_end - event_start).total_seconds() / 60
-                total_minutes += duration
+        if exclude_id:
+            for event in self._work_meeting_by_day.get(date, ()):
+                if event['id'] == exclude_id:
+                    total_minutes -= event['minutes']
         
         return total_minutes
     
+    @staticmethod
+    def _week_of(day: date) -> date:
+        """Monday of the week containing day."""
+        return day - timedelta(days=day.weekday())
+    
+    def _category_code(self, category) -> int:
+        """Int code for a category; unknown categories get the next free code."""
+        code = self._category_codes.get(category)
+        if code is None:
+            code = self._category_codes[category] = len(self._category_codes) + 1
+        return code
+    
+    def _prepare_event(self, event: Dict) -> Dict:
+        """Copy the fields the checks use, with start/end parsed to datetimes."""
+        start, start_ts = self._parse_timestamp(event['start'])
+        end, end_ts = self._parse_timestamp(event['end'])
+        category = event.get('category')
+        return {
+            'id': event.get('id'),
+            'title': event.get('title'),
+            'category': category,
+            'cat_code': self._category_code(category),
+            'start': start,
+            'end': end,
+            'start_ts': start_ts,
+            'end_ts': end_ts,
+            'minutes': (end_ts - start_ts) / 60
+        }
+    
+    @staticmethod
+    def _to_seconds(dt: datetime) -> int:
+        """Whole seconds since the epoch (naive datetimes stay in local wall-clock time)."""
+        if dt.tzinfo is None:
+            return (dt - _EPOCH) // _ONE_SECOND
+        return (dt - _EPOCH_UTC) // _ONE_SECOND
+    
+    @staticmethod
+    def _seconds_of_day(t) -> int:
+        """Seconds since midnight for a time or datetime (microseconds ignored)."""
+        return t.hour * 3600 + t.minute * 60 + t.second
+    
+    @staticmethod
+    @lru_cache(maxsize=_TIMESTAMP_CACHE_SIZE)
+    def _parse_timestamp(iso_string: str) -> Tuple[datetime, int]:
+        """
+        Parse an existing event's timestamp to (datetime, epoch seconds).
+        Memoized: every request builds a new validator over mostly the same
+        schedule, so repeat loads skip parsing. Datetimes are immutable, so
+        sharing them between validators is safe.
+        """
+        dt = EventValidator._parse_iso(iso_string)
+        return dt, EventValidator._to_seconds(dt)
+    
     @staticmethod
     def _parse_iso(iso_string: str) -> datetime:
         """Parse ISO format datetime string."""
-        return datetime.fromisoformat(iso_string.replace('Z', '+00:00'))
+        # Only rewrite a trailing 'Z' on older Pythons, and only when present
+        if _FROMISO_HANDLES_Z or iso_string[-1:] != 'Z':
+            return datetime.fromisoformat(iso_string)
+        return datetime.fromisoformat(iso_string[:-1] + '+00:00')
     
     @staticmethod
     def _parse_time(time_string: str) -> time:
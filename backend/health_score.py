@@ -7,8 +7,100 @@ Note: "Breaks" are just gaps in the schedule - not events. We analyze gap presen
 but give much higher weight to active recovery (Recreational/Meal events).
 """
 
+import copy
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
 from datetime import datetime, timedelta, time
-from collections import defaultdict
+from functools import lru_cache
+
+# Event times are stored as whole seconds since this (naive) epoch
+_EPOCH = datetime(1970, 1, 1)
+_ONE_SECOND = timedelta(seconds=1)
+_EPOCH_WEEKDAY = _EPOCH.weekday()   # Thursday; weekday of day n is (n + 3) % 7
+
+# Parsed timestamps are shared across calculators (the optimizer scores the
+# same week several times per request)
+_PARSE_CACHE_SIZE = 8192
+
+# Columns of the per-day table (seconds scheduled per category)
+_DAILY_COLUMNS = {'Work': 0, 'Meeting': 1, 'Recreational': 2, 'Meal': 3}
+_OTHER_COLUMN = 4
+
+# Scores kept for repeat requests over an unchanged week (least recently used
+# evicted first), keyed by calculate_score's events/preferences key
+_SCORE_CACHE_SIZE = 256
+_score_cache = OrderedDict()
+_score_cache_lock = threading.Lock()
+
+# Metrics to recompute after an edit to an event of each category (see
+# update_event). Sleep and recovery gaps look at every event, so they are
+# always recomputed; Personal and other events never touch the rest.
+_ALWAYS_AFFECTED = ('sleep', 'recovery')
+_AFFECTED_METRICS = {
+    'Work': ('work_life', 'focus', 'meetings'),
+    'Meeting': ('work_life', 'focus', 'meetings'),
+    'Recreational': ('work_life',),     # "personal time" case of an empty work week
+    'Meal': ('work_life',),
+}
+
+# Lowest weekly work target considered when suggesting a reduction
+_SUGGESTION_MIN_HOURS = 30
+
+
+# Score curves (piecewise linear in one input). Kept as plain functions so the
+# metrics and the "what-if" predictions in the suggestions share one formula.
+
+def _work_life_curve(work_hours):
+    """Base work/life score for weekly work hours (WHO research)."""
+    if work_hours < 35:
+        return 100 - ((35 - work_hours) / 5) * 5  # Small penalty for under-work
+    if work_hours <= 45:
+        return 100
+    if work_hours <= 55:
+        return 100 - ((work_hours - 45) / 10) * 30  # Linear 100→70
+    if work_hours <= 65:
+        # Balanced: Moderate penalty for overwork (55-65h range)
+        return 40 - ((work_hours - 55) / 10) * 10  # 40→30 (clean 1 point per hour)
+    # >65h - BURNOUT TERRITORY
+    # Balanced: Gradual decline for extreme overwork
+    return max(0, 30 - ((work_hours - 65) / 5) * 5)  # 30→25→20... (1 point per hour)
+
+
+def _focus_curve(focus_hours):
+    """Focus score for weekly hours in uninterrupted 90+ min blocks (optimal: ≥8h)."""
+    if focus_hours >= 8:
+        return 100
+    if focus_hours >= 4:
+        return 80 + (focus_hours - 4) / 4 * 20  # 80-100
+    if focus_hours >= 2:
+        return 60 + (focus_hours - 2) / 2 * 20  # 60-80
+    return 40 if focus_hours > 0 else 0
+
+
+def _meeting_share_curve(meeting_share):
+    """Base meeting score for the share of work time spent in meetings."""
+    if meeting_share <= 0.30:
+        return 100 - (meeting_share * 50)  # 100 at 0%, 85 at 30%
+    if meeting_share <= 0.50:
+        return 85 - ((meeting_share - 0.30) / 0.20) * 25  # 85→60
+    # Gartner: >50% = 40% productivity drop
+    return 60 - ((meeting_share - 0.50) / 0.50) * 30  # 60→30
+
+
+def _active_recovery_curve(recovery_hours):
+    """Active recovery score for weekly Recreational/Meal hours (ideal: 7-14h)."""
+    if 7 <= recovery_hours <= 14:
+        return 100
+    if recovery_hours > 14:
+        # Balanced: Penalize excessive recreation without extreme drops
+        # Clean numbers: 2 points per excess hour (14h→50% at 39h, 0% at 64h)
+        excess = recovery_hours - 14
+        penalty = excess * 2  # Clean multiplier, NO CAP
+        return max(0, 100 - penalty)  # Can reach 0 at 64h
+    if recovery_hours >= 3.5:  # Half of ideal minimum
+        return 50 + (recovery_hours / 7) * 50  # Scale 50-100
+    return (recovery_hours / 3.5) * 50  # Scale 0-50
 
 
 class HealthScoreCalculator:
@@ -33,30 +125,179 @@ class HealthScoreCalculator:
         """
         self.events = events
         self.preferences = preferences
+        
+        # Preference boundaries, parsed once as seconds since midnight so the
+        # metrics compare plain ints against the events' epoch seconds
+        self._work_start_sod = self._seconds_of_day(
+            self._parse_time_string(preferences.get('work_start', '09:00')))
+        self._work_end_sod = self._seconds_of_day(
+            self._parse_time_string(preferences.get('work_end', '18:00')))
+        self._sleep_start_sod = self._seconds_of_day(
+            self._parse_time_string(preferences.get('sleep_start', '23:00')))
+        self._sleep_end_sod = self._seconds_of_day(
+            self._parse_time_string(preferences.get('sleep_end', '07:00')))
+        
+        # Metric results by name, kept until an edit affects them
+        self._metrics = {}
+        self._owns_events = False   # self.events is still the caller's list
+        
+        self._index_events()
+    
+    def _index_events(self):
+        """Build the per-event arrays and indexes the metrics read from self.events."""
         self.work_events = []
         self.meetings = []
         self.recreational_events = []
         self.meal_events = []
         
+        # Parse every event once into parallel arrays (struct of arrays), indexed
+        # like self.events; the metrics read these instead of re-parsing ISO strings
+        self._start_s = []      # Start, in epoch seconds
+        self._end_s = []        # End, in epoch seconds
+        self._minutes = []      # Duration in minutes
+        self._day = []          # Start day, in days since the epoch
+        self._column = []       # Column of the per-day table (see _DAILY_COLUMNS)
+        
+        # Per-category positions into the arrays, in input order
+        self._work_idx = []
+        self._meeting_idx = []
+        self._recreational_idx = []
+        self._meal_idx = []
+        
         # Categorize events
-        for event in events:
+        for index, event in enumerate(self.events):
+            start = self._parse_iso(event['start'])
+            end = self._parse_iso(event['end'])
+            start_s = (start - _EPOCH) // _ONE_SECOND
+            end_s = (end - _EPOCH) // _ONE_SECOND
+            self._start_s.append(start_s)
+            self._end_s.append(end_s)
+            self._minutes.append((end_s - start_s) / 60)
+            self._day.append(start_s // 86400)
+            
             category = event.get('category', 'Personal')
+            self._column.append(_DAILY_COLUMNS.get(category, _OTHER_COLUMN))
             if category == 'Work':
                 self.work_events.append(event)
+                self._work_idx.append(index)
             elif category == 'Meeting':
                 self.meetings.append(event)
+                self._meeting_idx.append(index)
             elif category == 'Recreational':
                 self.recreational_events.append(event)
+                self._recreational_idx.append(index)
             elif category == 'Meal':
                 self.meal_events.append(event)
+                self._meal_idx.append(index)
+        
+        # Seconds per category for each start day, shared by the metrics that
+        # aggregate per day or per category. Dense rows indexed by day offset
+        # from the first day, so no date objects or dict probes are involved.
+        first_day = min(self._day, default=0)
+        n_days = max(self._day, default=first_day - 1) - first_day + 1
+        self._daily = [[0] * (_OTHER_COLUMN + 1) for _ in range(n_days)]
+        for day, column, start_s, end_s in zip(self._day, self._column, self._start_s, self._end_s):
+            self._daily[day - first_day][column] += end_s - start_s
+        
+        # Work and meetings together (work first), as most metrics use them
+        self._work_meeting_idx = self._work_idx + self._meeting_idx
+        
+        # All start times in order, for the "next event after X" sweep in recovery
+        self._sorted_start_s = sorted(self._start_s)
+        
+        # Meeting starts in order, with the running max of their ends: a block
+        # overlaps a meeting iff some meeting starting before the block ends
+        # also ends after it starts
+        meeting_spans = sorted((self._start_s[i], self._end_s[i]) for i in self._meeting_idx)
+        self._meeting_starts = [start for start, _ in meeting_spans]
+        self._meeting_max_end = []
+        max_end = None
+        for _, end in meeting_spans:
+            if max_end is None or end > max_end:
+                max_end = end
+            self._meeting_max_end.append(max_end)
+    
+    def add_event(self, event):
+        """
+        Add an event to the schedule being scored. The next calculate_score
+        only recomputes the metrics this event can affect.
+        """
+        self._own_events()
+        self.events.append(event)
+        self._changed(event)
+    
+    def remove_event(self, event_id):
+        """
+        Remove the event with this id from the schedule being scored.
+        
+        Returns:
+            True if an event was removed, False if none had this id
+        """
+        for index, event in enumerate(self.events):
+            if event.get('id') == event_id:
+                self._own_events()
+                del self.events[index]
+                self._changed(event)
+                return True
+        return False
+    
+    def update_event(self, event_id, changes):
+        """
+        Apply changes (e.g. new start/end) to the event with this id, e.g. to
+        score a dragged or resized event without building a new calculator.
+        The caller's event dicts are never modified.
+        
+        Returns:
+            True if an event was updated, False if none had this id
+        """
+        for index, event in enumerate(self.events):
+            if event.get('id') == event_id:
+                self._own_events()
+                updated = dict(event, **changes)
+                self.events[index] = updated
+                self._changed(event, updated)
+                return True
+        return False
     
     def calculate_score(self):
         """
         Calculate comprehensive health score.
         
+        The score depends only on each event's start, end and category and on
+        the preferences, so results are memoized on exactly those values: a
+        repeat call over an unchanged week is a lookup, and editing any event
+        changes the key.
+        
         Returns:
             Dictionary with score, breakdown, issues, suggestions, and stats
         """
+        try:
+            key = (
+                tuple((e['start'], e['end'], e.get('category', 'Personal')) for e in self.events),
+                tuple(sorted(self.preferences.items()))
+            )
+            hash(key)
+        except TypeError:
+            # Unhashable input - compute without the cache
+            return self._calculate_score()
+        
+        with _score_cache_lock:
+            result = _score_cache.get(key)
+            if result is not None:
+                _score_cache.move_to_end(key)
+        
+        if result is None:
+            result = self._calculate_score()
+            with _score_cache_lock:
+                _score_cache[key] = result
+                if len(_score_cache) > _SCORE_CACHE_SIZE:
+                    _score_cache.popitem(last=False)
+        
+        # Callers add fields to the result, so hand out a copy
+        return copy.deepcopy(result)
+    
+    def _calculate_score(self):
+        """Compute the health score (see calculate_score), reusing unaffected metrics."""
         # CRITICAL FIX: Check for empty schedule first
         total_events = len(self.work_events + self.meetings + self.recreational_events + self.meal_events)
         if total_events == 0:
@@ -93,11 +334,11 @@ class HealthScoreCalculator:
             }
         
         # Calculate individual metrics
-        work_life_data = self._calculate_work_life_balance()
-        sleep_data = self._calculate_sleep_respect()
-        focus_data = self._calculate_focus_blocks()
-        meeting_data = self._calculate_meeting_load()
-        recovery_data = self._calculate_recovery_time()
+        work_life_data = self._metric('work_life', self._calculate_work_life_balance)
+        sleep_data = self._metric('sleep', self._calculate_sleep_respect)
+        focus_data = self._metric('focus', self._calculate_focus_blocks)
+        meeting_data = self._metric('meetings', self._calculate_meeting_load)
+        recovery_data = self._metric('recovery', self._calculate_recovery_time)
         
         # Composite score
         composite = (
@@ -138,7 +379,7 @@ class HealthScoreCalculator:
     def _calculate_work_life_balance(self):
         """Calculate work/life balance score (25% weight)."""
         # Combine work events and meetings
-        work_events = self.work_events + self.meetings
+        work_events = self._work_meeting_idx
         
         if not work_events:
             # CRITICAL FIX: No work scheduled
@@ -164,39 +405,34 @@ class HealthScoreCalculator:
                     'message': 'No events scheduled'
                 }
         
+        work_start = self._work_start_sod
+        work_end = self._work_end_sod
+        
+        # One pass over work/meeting events for total minutes and weekend/night
+        # minutes; weekday and time of day come straight from the epoch seconds
+        minutes = self._minutes
+        start_s = self._start_s
+        days = self._day
+        total_minutes = 0
+        weekend_night_minutes = 0
+        for i in work_events:
+            duration = minutes[i]
+            total_minutes += duration
+            weekday = (days[i] + _EPOCH_WEEKDAY) % 7
+            if weekday >= 5 or not (work_start <= start_s[i] % 86400 < work_end):
+                weekend_night_minutes += duration
+        
         # Total work hours
-        total_minutes = sum(self._calculate_duration(e) for e in work_events)
         work_hours = total_minutes / 60
         
         # Base score from weekly hours (WHO research)
-        if 35 <= work_hours <= 45:
-            base_score = 100
-        elif 45 < work_hours <= 55:
-            base_score = 100 - ((work_hours - 45) / 10) * 30  # Linear 100→70
-        elif work_hours < 35:
-            base_score = 100 - ((35 - work_hours) / 5) * 5  # Small penalty for under-work
-        elif 55 < work_hours <= 65:
-            # Balanced: Moderate penalty for overwork (55-65h range)
-            base_score = 40 - ((work_hours - 55) / 10) * 10  # 40→30 (clean 1 point per hour)
-        else:  # >65h - BURNOUT TERRITORY
-            # Balanced: Gradual decline for extreme overwork
-            base_score = max(0, 30 - ((work_hours - 65) / 5) * 5)  # 30→25→20... (1 point per hour)
-        
-        # Count long days (>10h work/meetings per day)
-        daily_hours = self._group_by_day(work_events)
-        long_days = sum(1 for hours in daily_hours.values() if hours > 10)
+        base_score = _work_life_curve(work_hours)
+        
+        # Count long days (>10h work/meetings per day), from the per-day table
+        long_days = sum(1 for day in self._daily if day[0] + day[1] > 10 * 3600)
         long_day_penalty = max(0, (long_days - 1) * 3)
         
         # Weekend/night work penalty
-        work_start = self._parse_time_string(self.preferences.get('work_start', '09:00'))
-        work_end = self._parse_time_string(self.preferences.get('work_end', '18:00'))
-        
-        weekend_night_minutes = 0
-        for event in work_events:
-            dt = self._parse_iso(event['start'])
-            if dt.weekday() >= 5 or not (work_start <= dt.time() < work_end):
-                weekend_night_minutes += self._calculate_duration(event)
-        
         weekend_penalty = weekend_night_minutes / 60
         
         final_score = max(0, base_score - long_day_penalty - weekend_penalty)
@@ -210,17 +446,23 @@ class HealthScoreCalculator:
     
     def _calculate_sleep_respect(self):
         """Calculate sleep respect score (25% weight)."""
-        sleep_start = self._parse_time_string(self.preferences.get('sleep_start', '23:00'))
-        sleep_end = self._parse_time_string(self.preferences.get('sleep_end', '07:00'))
-        
-        # Check for events overlapping sleep window
+        # Sleep window relative to the midnight starting each event's day, in
+        # seconds; a window that crosses midnight ends on the next day
+        window_start = self._sleep_start_sod
+        window_end = self._sleep_end_sod
+        if window_start > window_end:
+            window_end += 86400
+        
+        # Check for events overlapping sleep window (plain int arithmetic per event)
         sleep_intrusion_hours = 0
         intrusion_count = 0
         
-        for event in self.events:
-            overlap = self._calculate_sleep_overlap(event, sleep_start, sleep_end)
-            if overlap > 0:
-                sleep_intrusion_hours += overlap
+        for start_s, end_s in zip(self._start_s, self._end_s):
+            midnight = start_s - start_s % 86400
+            overlap_start = max(start_s, midnight + window_start)
+            overlap_end = min(end_s, midnight + window_end)
+            if overlap_start < overlap_end:
+                sleep_intrusion_hours += (overlap_end - overlap_start) / 3600
                 intrusion_count += 1
         
         # CRITICAL FIX: Sleep is NON-NEGOTIABLE - no cap on penalty
@@ -255,11 +497,11 @@ class HealthScoreCalculator:
         focus_blocks_count = 0
         interrupted_blocks = 0
         
-        for event in self.work_events:
-            duration = self._calculate_duration(event)
+        for i in self._work_idx:
+            duration = self._minutes[i]
             if duration >= 90:  # 90+ minute work blocks
                 # Check for interruptions during this block
-                has_meeting = self._check_overlapping_meetings(event)
+                has_meeting = self._check_overlapping_meetings(i)
                 if not has_meeting:
                     focus_hours += duration / 60
                     focus_blocks_count += 1
@@ -267,14 +509,7 @@ class HealthScoreCalculator:
                     interrupted_blocks += 1
         
         # Scoring (optimal: ≥8h/week of 90+ min blocks)
-        if focus_hours >= 8:
-            score = 100
-        elif focus_hours >= 4:
-            score = 80 + (focus_hours - 4) / 4 * 20  # 80-100
-        elif focus_hours >= 2:
-            score = 60 + (focus_hours - 2) / 2 * 20  # 60-80
-        else:
-            score = 40 if focus_hours > 0 else 0
+        score = _focus_curve(focus_hours)
         
         return {
             'score': int(score),
@@ -285,7 +520,7 @@ class HealthScoreCalculator:
     
     def _calculate_meeting_load(self):
         """Calculate meeting load score (15% weight) - Microsoft research."""
-        work_events = self.work_events + self.meetings
+        work_events = self._work_meeting_idx
         
         if not work_events:
             # No work or meetings scheduled
@@ -307,21 +542,26 @@ class HealthScoreCalculator:
                 'message': 'Deep work mode - no meetings'
             }
         
+        # Meeting totals and long-meeting count in one pass
+        minutes = self._minutes
+        total_work_minutes = sum(minutes[i] for i in self._work_idx)
+        meeting_minutes = 0
+        long_meetings = 0
+        for i in self._meeting_idx:
+            duration = minutes[i]
+            total_work_minutes += duration
+            meeting_minutes += duration
+            if duration > 60:
+                long_meetings += 1
+        
         # Calculate meeting share
-        total_work_minutes = sum(self._calculate_duration(e) for e in work_events)
-        meeting_minutes = sum(self._calculate_duration(e) for e in self.meetings)
         meeting_share = meeting_minutes / total_work_minutes if total_work_minutes > 0 else 0
         
         # Base score from share (Gartner: >50% = 40% productivity drop)
-        if meeting_share <= 0.30:
-            base_score = 100 - (meeting_share * 50)  # 100 at 0%, 85 at 30%
-        elif meeting_share <= 0.50:
-            base_score = 85 - ((meeting_share - 0.30) / 0.20) * 25  # 85→60
-        else:
-            base_score = 60 - ((meeting_share - 0.50) / 0.50) * 30  # 60→30
+        base_score = _meeting_share_curve(meeting_share)
         
         # Back-to-back penalty (Microsoft: <10min gap → stress)
-        meetings_sorted = sorted(self.meetings, key=lambda x: x['start'])
+        meetings_sorted = sorted(self._meeting_idx, key=lambda i: self.events[i]['start'])
         b2b_count = 0
         for i in range(len(meetings_sorted) - 1):
             gap = self._calculate_gap_minutes(meetings_sorted[i], meetings_sorted[i+1])
@@ -330,7 +570,6 @@ class HealthScoreCalculator:
         b2b_penalty = min(b2b_count * 2, 20)
         
         # Long meeting penalty (Atlassian: fatigue after 4-5h/day)
-        long_meetings = sum(1 for m in self.meetings if self._calculate_duration(m) > 60)
         long_penalty = min(long_meetings, 10)
         
         final_score = max(0, base_score - b2b_penalty - long_penalty)
@@ -354,63 +593,47 @@ class HealthScoreCalculator:
         Rationale: Active recovery >> passive gaps
         """
         # Part 1: Active recovery events (80% weight)
-        active_recovery_events = self.recreational_events + self.meal_events
-        total_recovery_minutes = sum(self._calculate_duration(e) for e in active_recovery_events)
-        recovery_hours = total_recovery_minutes / 60
+        minutes = self._minutes
+        active_recovery_events = self._recreational_idx + self._meal_idx
+        recovery_seconds = sum(day[2] + day[3] for day in self._daily)
+        recovery_hours = recovery_seconds / 3600
         
         # CRITICAL FIX: Handle no recovery events
         if not active_recovery_events:
             active_score = 0  # No active recovery = not healthy
-        # Ideal: 1-2 hours of active recovery per day (7-14 hours per week)
-        elif 7 <= recovery_hours <= 14:
-            active_score = 100
-        elif recovery_hours > 14:
-            # Balanced: Penalize excessive recreation without extreme drops
-            # Clean numbers: 2 points per excess hour (14h→50% at 39h, 0% at 64h)
-            excess = recovery_hours - 14
-            penalty = excess * 2  # Clean multiplier, NO CAP
-            active_score = max(0, 100 - penalty)  # Can reach 0 at 64h
-        elif recovery_hours >= 3.5:  # Half of ideal minimum
-            active_score = 50 + (recovery_hours / 7) * 50  # Scale 50-100
         else:
-            active_score = (recovery_hours / 3.5) * 50  # Scale 0-50
-        
-        # Part 2: Gaps after meetings (15% weight) - important for mental reset
+            # Ideal: 1-2 hours of active recovery per day (7-14 hours per week)
+            active_score = _active_recovery_curve(recovery_hours)
+        
+        # Parts 2 and 3 in one sweep: each meeting (15% weight - important for
+        # mental reset) and long work block (5% weight - minor factor) needs a
+        # 5+ min gap before the next event starts. Walking the blocks in end
+        # order, the next start only moves forward, so one pointer over the
+        # sorted start times serves them all.
+        long_work_blocks = [i for i in self._work_idx if minutes[i] >= 90]
+        blocks = sorted(
+            [(self._end_s[i], True) for i in self._meeting_idx] +
+            [(self._end_s[i], False) for i in long_work_blocks]
+        )
+        starts = self._sorted_start_s
+        next_index = 0
         meetings_with_gaps = 0
-        for meeting in self.meetings:
-            meeting_end = self._parse_iso(meeting['end'])
+        work_blocks_with_gaps = 0
+        for block_end, is_meeting in blocks:
             # Find next event
-            next_event_start = None
-            for event in self.events:
-                event_start = self._parse_iso(event['start'])
-                if event_start > meeting_end:
-                    if next_event_start is None or event_start < next_event_start:
-                        next_event_start = event_start
+            while next_index < len(starts) and starts[next_index] <= block_end:
+                next_index += 1
+            if next_index == len(starts):
+                continue
             
-            if next_event_start:
-                gap_minutes = (next_event_start - meeting_end).total_seconds() / 60
-                if gap_minutes >= 5:  # At least 5min gap
+            gap_minutes = (starts[next_index] - block_end) / 60
+            if gap_minutes >= 5:  # At least 5min gap
+                if is_meeting:
                     meetings_with_gaps += 1
-        
-        meeting_gap_score = 100 if len(self.meetings) == 0 else (meetings_with_gaps / len(self.meetings)) * 100
-        
-        # Part 3: Gaps after long work blocks (5% weight) - minor factor
-        long_work_blocks = [e for e in self.work_events if self._calculate_duration(e) >= 90]
-        work_blocks_with_gaps = 0
-        for block in long_work_blocks:
-            block_end = self._parse_iso(block['end'])
-            next_event_start = None
-            for event in self.events:
-                event_start = self._parse_iso(event['start'])
-                if event_start > block_end:
-                    if next_event_start is None or event_start < next_event_start:
-                        next_event_start = event_start
-            
-            if next_event_start:
-                gap_minutes = (next_event_start - block_end).total_seconds() / 60
-                if gap_minutes >= 5:
+                else:
                     work_blocks_with_gaps += 1
         
+        meeting_gap_score = 100 if len(self.meetings) == 0 else (meetings_with_gaps / len(self.meetings)) * 100
         work_gap_score = 100 if len(long_work_blocks) == 0 else (work_blocks_with_gaps / len(long_work_blocks)) * 100
         
         # Weighted composite
@@ -483,12 +706,20 @@ class HealthScoreCalculator:
         # Work/Life Balance suggestions
         wl_data = breakdown['work_life']
         if wl_data['hours'] > 50:
-            target = 45
-            reduction = wl_data['hours'] - target
-            new_score = self._predict_work_life_score(target)
+            # Score a grid of lower weekly targets on the work/life curve: aim for the
+            # smallest cut that reaches the best score, and offer a halfway step
+            hours = wl_data['hours']
+            targets = [t / 2 for t in range(2 * _SUGGESTION_MIN_HOURS, int(2 * hours))]
+            predicted = [int(_work_life_curve(t)) for t in targets]
+            best = max(predicted)
+            target = max(t for t, score in zip(targets, predicted) if score == best)
+            step = targets[(targets.index(target) + len(targets)) // 2]
+            alternative = ""
+            if step > target:
+                alternative = f", or to {step:g}h (-{hours - step:.1f}h) → {int(_work_life_curve(step))}"
             suggestions.append(
-                f"💡 Reduce work hours to {target}h/week (-{reduction:.1f}h) → Score improves to {new_score} "
-                f"(Stanford: Productivity plateaus at 45h)"
+                f"💡 Reduce work hours to {target:g}h/week (-{hours - target:.1f}h) → Score improves to {best}"
+                f"{alternative} (Stanford: Productivity plateaus at 45h)"
             )
         
         if wl_data['long_days'] > 1:
@@ -557,88 +788,59 @@ class HealthScoreCalculator:
     
     # Helper methods
     
-    def _calculate_duration(self, event):
-        """Calculate event duration in minutes."""
-        start = self._parse_iso(event['start'])
-        end = self._parse_iso(event['end'])
-        return (end - start).total_seconds() / 60
+    def _metric(self, name, calculate):
+        """Result of a metric, computed only if no edit has invalidated it."""
+        if name not in self._metrics:
+            self._metrics[name] = calculate()
+        return self._metrics[name]
+    
+    def _own_events(self):
+        """Copy the caller's event list before the first edit."""
+        if not self._owns_events:
+            self.events = list(self.events)
+            self._owns_events = True
+    
+    def _changed(self, *events):
+        """Re-index after an edit and drop the metrics the edited events affect."""
+        affected = set(_ALWAYS_AFFECTED)
+        for event in events:
+            affected.update(_AFFECTED_METRICS.get(event.get('category', 'Personal'), ()))
+        for name in affected:
+            self._metrics.pop(name, None)
+        # Parsing is memoized, so re-indexing only parses the edited event
+        self._index_events()
     
-    def _parse_iso(self, date_string):
-        """Parse ISO datetime string."""
+    @staticmethod
+    @lru_cache(maxsize=_PARSE_CACHE_SIZE)
+    def _parse_iso(date_string):
+        """
+        Parse ISO datetime string (memoized; datetimes are immutable).
+        Results are naive wall-clock times truncated to whole seconds, as the
+        metrics assume: a trailing 'Z', UTC offset or fraction is dropped.
+        """
         if date_string.endswith('Z'):
             date_string = date_string[:-1]
-        if '.' in date_string:
-            date_string = date_string.split('.')[0]
-        try:
-            return datetime.strptime(date_string, "%Y-%m-%dT%H:%M:%S")
-        except ValueError:
-            return datetime.strptime(date_string, "%Y-%m-%dT%H:%M")
+        # fromisoformat is implemented in C and much faster than strptime
+        return datetime.fromisoformat(date_string).replace(tzinfo=None, microsecond=0)
     
-    def _parse_time_string(self, time_string):
-        """Parse time string in HH:MM format to time object."""
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _parse_time_string(time_string):
+        """Parse time string in HH:MM format to time object (memoized)."""
         return datetime.strptime(time_string, "%H:%M").time()
     
-    def _group_by_day(self, events):
-        """Group events by day and sum hours."""
-        daily_hours = defaultdict(float)
-        for event in events:
-            dt = self._parse_iso(event['start'])
-            day_key = dt.date()
-            duration_hours = self._calculate_duration(event) / 60
-            daily_hours[day_key] += duration_hours
-        return daily_hours
-    
-    def _calculate_sleep_overlap(self, event, sleep_start, sleep_end):
-        """Calculate hours of event overlapping with sleep window."""
-        event_start = self._parse_iso(event['start'])
-        event_end = self._parse_iso(event['end'])
-        
-        # Create sleep window for the event's day
-        event_date = event_start.date()
-        
-        # Handle sleep window that crosses midnight
-        if sleep_start > sleep_end:
-            # Sleep starts today, ends tomorrow
-            sleep_window_start = datetime.combine(event_date, sleep_start)
-            sleep_window_end = datetime.combine(event_date + timedelta(days=1), sleep_end)
-        else:
-            # Sleep is within same day
-            sleep_window_start = datetime.combine(event_date, sleep_start)
-            sleep_window_end = datetime.combine(event_date, sleep_end)
-        
-        # Calculate overlap
-        overlap_start = max(event_start, sleep_window_start)
-        overlap_end = min(event_end, sleep_window_end)
-        
-        if overlap_start < overlap_end:
-            return (overlap_end - overlap_start).total_seconds() / 3600
-        return 0
-    
-    def _check_overlapping_meetings(self, work_event):
-        """Check if work event has overlapping meetings."""
-        work_start = self._parse_iso(work_event['start'])
-        work_end = self._parse_iso(work_event['end'])
-        
-        for meeting in self.meetings:
-            meeting_start = self._parse_iso(meeting['start'])
-            meeting_end = self._parse_iso(meeting['end'])
-            
-            # Check for any overlap
-            if meeting_start < work_end and meeting_end > work_start:
-                return True
-        return False
+    @staticmethod
+    def _seconds_of_day(t):
+        """Seconds since midnight for a time object."""
+        return t.hour * 3600 + t.minute * 60 + t.second
     
-    def _calculate_gap_minutes(self, event1, event2):
-        """Calculate gap in minutes between two events."""
-        end1 = self._parse_iso(event1['end'])
-        start2 = self._parse_iso(event2['start'])
-        return (start2 - end1).total_seconds() / 60
+    def _check_overlapping_meetings(self, index):
+        """Check if work event (position into the arrays) has overlapping meetings."""
+        # Meetings starting before the block ends are the first `count` ones
+        count = bisect_left(self._meeting_starts, self._end_s[index])
+        return count > 0 and self._meeting_max_end[count - 1] > self._start_s[index]
     
-    def _predict_work_life_score(self, target_hours):
-        """Predict work/life score for target hours."""
-        if 35 <= target_hours <= 45:
-            return 100
-        elif 45 < target_hours <= 55:
-            return int(100 - ((target_hours - 45) / 10) * 30)
-        else:
-            return 40
+    def _calculate_gap_minutes(self, index1, index2):
+        """Calculate gap in minutes between two events (positions into the arrays)."""
+        return (self._start_s[index2] - self._end_s[index1]) / 60
+
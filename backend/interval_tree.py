@@ -0,0 +1,219 @@
+"""
+Interval Tree
+Augmented AVL tree for "which intervals overlap [lo, hi)?" queries.
+Each node also stores the largest end time in its subtree, so whole
+branches that finish before the query window are skipped.
+Queries cost O(log N + k) instead of a scan over every interval.
+"""
+
+from itertools import count
+from typing import Any, Iterable, List, Optional, Tuple
+
+
+class _Node:
+    """Tree node: one interval plus AVL height and subtree max end."""
+    
+    __slots__ = ('key', 'start', 'end', 'payload', 'max_end', 'height', 'left', 'right')
+    
+    def __init__(self, key, start, end, payload):
+        self.key = key            # (start, insertion order) - unique sort key
+        self.start = start
+        self.end = end
+        self.payload = payload
+        self.max_end = end
+        self.height = 1
+        self.left = None
+        self.right = None
+
+
+class IntervalTree:
+    """
+    Intervals ordered by start time. Intervals are half-open: [start, end)
+    overlaps [lo, hi) when start < hi and end > lo.
+    Intervals with equal starts keep their insertion order.
+    """
+    
+    def __init__(self, intervals: Optional[Iterable[Tuple[Any, Any, Any]]] = None):
+        """
+        Create a tree, optionally bulk-loaded.
+        
+        Args:
+            intervals: Optional iterable of (start, end, payload) tuples.
+                       Bulk loading builds a balanced tree in O(N log N) for the
+                       sort, with no rotations.
+        """
+        self._order = count()
+        self._size = 0
+        self._root = None
+        
+        if intervals is not None:
+            nodes = [
+                _Node((start, next(self._order)), start, end, payload)
+                for start, end, payload in intervals
+            ]
+            nodes.sort(key=lambda n: n.key)
+            self._size = len(nodes)
+            self._root = self._build(nodes, 0, len(nodes))
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def insert(self, interval: Tuple[Any, Any], payload: Any = None) -> None:
+        """Add (start, end) with an attached payload."""
+        start, end = interval
+        node = _Node((start, next(self._order)), start, end, payload)
+        self._root = self._insert(self._root, node)
+        self._size += 1
+    
+    def delete(self, interval: Tuple[Any, Any], payload: Any = None) -> bool:
+        """
+        Remove one interval equal to (start, end) whose payload == payload.
+        
+        Returns:
+            True if an interval was removed, False if none matched
+        """
+        start, end = interval
+        match = self._find(self._root, start, end, payload)
+        if match is None:
+            return False
+        self._root = self._delete(self._root, match.key)
+        self._size -= 1
+        return True
+    
+    def query(self, lo: Any, hi: Any) -> List[Any]:
+        """
+        Payloads of all intervals overlapping [lo, hi), ordered by start.
+        
+        Args:
+            lo: Window start (intervals must end after this)
+            hi: Window end (intervals must start before this)
+        """
+        results = []
+        self._query(self._root, lo, hi, results)
+        return results
+    
+    # === Internal helpers ===
+    
+    @classmethod
+    def _build(cls, nodes, lo, hi):
+        """Balanced subtree from nodes[lo:hi] (already sorted by key)."""
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = nodes[mid]
+        node.left = cls._build(nodes, lo, mid)
+        node.right = cls._build(nodes, mid + 1, hi)
+        cls._update(node)
+        return node
+    
+    @staticmethod
+    def _height(node):
+        return node.height if node else 0
+    
+    @classmethod
+    def _update(cls, node):
+        """Recompute height and max_end from the children."""
+        node.height = 1 + max(cls._height(node.left), cls._height(node.right))
+        max_end = node.end
+        if node.left and node.left.max_end > max_end:
+            max_end = node.left.max_end
+        if node.right and node.right.max_end > max_end:
+            max_end = node.right.max_end
+        node.max_end = max_end
+    
+    @classmethod
+    def _rotate_right(cls, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        cls._update(node)
+        cls._update(pivot)
+        return pivot
+    
+    @classmethod
+    def _rotate_left(cls, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        cls._update(node)
+        cls._update(pivot)
+        return pivot
+    
+    @classmethod
+    def _rebalance(cls, node):
+        cls._update(node)
+        balance = cls._height(node.left) - cls._height(node.right)
+        
+        if balance > 1:
+            if cls._height(node.left.left) < cls._height(node.left.right):
+                node.left = cls._rotate_left(node.left)
+            return cls._rotate_right(node)
+        
+        if balance < -1:
+            if cls._height(node.right.right) < cls._height(node.right.left):
+                node.right = cls._rotate_right(node.right)
+            return cls._rotate_left(node)
+        
+        return node
+    
+    @classmethod
+    def _insert(cls, node, new):
+        if node is None:
+            return new
+        if new.key < node.key:
+            node.left = cls._insert(node.left, new)
+        else:
+            node.right = cls._insert(node.right, new)
+        return cls._rebalance(node)
+    
+    @classmethod
+    def _find(cls, node, start, end, payload):
+        """First node (in key order) matching start, end and payload."""
+        if node is None:
+            return None
+        if start < node.start:
+            return cls._find(node.left, start, end, payload)
+        if node.start < start:
+            return cls._find(node.right, start, end, payload)
+        # Equal starts can sit on both sides of a node
+        found = cls._find(node.left, start, end, payload)
+        if found is None and node.end == end and node.payload == payload:
+            found = node
+        if found is None:
+            found = cls._find(node.right, start, end, payload)
+        return found
+    
+    @classmethod
+    def _delete(cls, node, key):
+        if node is None:
+            return None
+        if key < node.key:
+            node.left = cls._delete(node.left, key)
+        elif node.key < key:
+            node.right = cls._delete(node.right, key)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            # Replace with the in-order successor, then remove that from the right
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.right = cls._delete(node.right, successor.key)
+            successor.left = node.left
+            successor.right = node.right
+            node = successor
+        return cls._rebalance(node)
+    
+    @classmethod
+    def _query(cls, node, lo, hi, results):
+        # Nothing in this subtree ends after lo
+        if node is None or node.max_end <= lo:
+            return
+        cls._query(node.left, lo, hi, results)
+        # Right subtree starts at or after this node; stop once past hi
+        if node.start < hi:
+            if node.end > lo:
+                results.append(node.payload)
+            cls._query(node.right, lo, hi, results)
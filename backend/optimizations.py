@@ -8,9 +8,75 @@ Each optimization function:
 3. Returns modified events + predicted score improvement
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
+from bisect import bisect_left
 from collections import defaultdict
-import copy
+from functools import lru_cache
+import heapq
+import logging
+
+from interval_tree import IntervalTree
+
+logger = logging.getLogger(__name__)
+
+# Default search start for categories without work-hour placement
+# (built once rather than strptime'd for every event scheduled)
+_MEAL_SEARCH_TIME = time(12, 0)
+_DEFAULT_SEARCH_TIME = time(14, 0)
+
+# Sort ordinals for smart_optimize_week (unknown values sort with the last entry)
+_PRIORITY_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+_TYPE_ORDER = {'fixed': 0, 'recurring': 1, 'floating': 2}
+_CATEGORY_ORDER = {'Work': 0, 'Meeting': 1, 'Recreational': 2, 'Meal': 3, 'Personal': 4}
+
+# Moveable durations whose coefficient of variation is below this count as
+# interchangeable, and smart_optimize_week deals them round-robin across the days
+_ROUND_ROBIN_MAX_CV = 0.15
+
+# Candidate slot starts are spaced this far apart
+_SLOT_STEP = timedelta(minutes=15)
+
+# Preferred windows are widened by this much for the second-best slot bonus
+_EXPANDED_MARGIN = timedelta(hours=1)
+
+# Inner loops compare integer microseconds since _EPOCH instead of datetimes
+_EPOCH = datetime(1970, 1, 1)
+_ONE_US = timedelta(microseconds=1)
+_SLOT_STEP_US = _SLOT_STEP // _ONE_US
+
+# Parsed event times are shared across engines (each request builds a new
+# engine over largely the same schedule)
+_PARSE_CACHE_SIZE = 4096
+
+
+def _hour_scores(best_hours, good_hours):
+    """Time of day fit per hour (0-23): 50 in the best hours, 30 in good ones, else 10."""
+    return tuple(50 if hour in best_hours else 30 if hour in good_hours else 10 for hour in range(24))
+
+
+# Time of day fit for each category, indexed by slot hour
+# Work/meetings prefer morning-midday (9-14); afternoon is OK
+_WORK_HOUR_SCORES = _hour_scores(range(9, 15), range(15, 18))
+# Personal prefers afternoon-evening (14-20); 12-14 and 20-22 are close to ideal
+_PERSONAL_HOUR_SCORES = _hour_scores(range(14, 21), (12, 13, 21, 22))
+# Meals prefer breakfast, lunch and dinner times, then the hours around them
+_MEAL_HOUR_SCORES = _hour_scores((7, 8, 12, 13, 18, 19), (6, 9, 11, 14, 17, 20))
+_TIME_OF_DAY_SCORES = {
+    'Work': _WORK_HOUR_SCORES,
+    'Meeting': _WORK_HOUR_SCORES,
+    'Personal': _PERSONAL_HOUR_SCORES,
+    'Recreational': _PERSONAL_HOUR_SCORES,
+    'Meal': _MEAL_HOUR_SCORES,
+}
+# Default: prefer work hours
+_DEFAULT_HOUR_SCORES = tuple(30 if 9 <= hour <= 17 else 10 for hour in range(24))
+
+# Upper bound of _score_slots: time of day (50) + centrality (30) + spacing (20)
+_MAX_SLOT_SCORE = 100
+
+# Events starting/ending closer than this to a slot count against its spacing score
+_NEARBY_WINDOW = timedelta(hours=2)
+_NEARBY_WINDOW_US = _NEARBY_WINDOW // _ONE_US
 
 
 class OptimizationEngine:
@@ -24,18 +90,120 @@ class OptimizationEngine:
             events: List of event dictionaries
             preferences: User preferences dictionary
         """
-        self.events = events
-        self.preferences = preferences
+        # Work on shallow copies carrying pre-parsed times, so each start/end
+        # string is parsed once here instead of on every pass over the schedule
         self.today = datetime.now().date()  # Track current date to prevent past modifications
-        self.work_events = [e for e in events if e.get('category') == 'Work']
-        self.meetings = [e for e in events if e.get('category') == 'Meeting']
-        self.personal_events = [e for e in events if e.get('category') == 'Personal']
-        self.recreational = [e for e in events if e.get('category') == 'Recreational']
+        self.events = [self._prepare_event(e) for e in events]
+        # Conflict checks query an interval tree over self.events: O(log N + k) per slot
+        self._tree = self._build_tree(self.events)
+        # Blocked slot runs per (date, duration, window) over self.events
+        self._blocked_cache = {}
+        # Longest inverted (end before start) event, so windowed tree queries
+        # still reach events whose end lies before their start
+        self._max_inversion = max([timedelta(0)] + [e['_start_dt'] - e['_end_dt'] for e in self.events])
+        self.preferences = preferences
+        # Preference times parsed once instead of strptime'd per scored slot
+        self._work_start_t = self._pref_time('work_start', '09:00')
+        self._work_end_t = self._pref_time('work_end', '18:00')
+        self._sleep_start_t = self._pref_time('sleep_start', '23:00')
+        self._sleep_end_t = self._pref_time('sleep_end', '07:00')
+        # Sleep bounds as minutes since midnight, for integer sleep-hour checks
+        self._sleep_start_min = self._sleep_start_t.hour * 60 + self._sleep_start_t.minute
+        self._sleep_end_min = self._sleep_end_t.hour * 60 + self._sleep_end_t.minute
+        self.work_events = [e for e in self.events if e.get('category') == 'Work']
+        self.meetings = [e for e in self.events if e.get('category') == 'Meeting']
+        self.personal_events = [e for e in self.events if e.get('category') == 'Personal']
+        self.recreational = [e for e in self.events if e.get('category') == 'Recreational']
+        # Work then meetings, concatenated once for the long-work scan
+        self._work_and_meetings = self.work_events + self.meetings
+        # Meetings in start order (stable, so equal starts keep schedule order)
+        self._meetings_sorted = sorted(self.meetings, key=lambda e: e['_start_dt'])
+        
+        # Moveable (unlocked, not past) counts, so optimizers with nothing to
+        # move return before any setup
+        self._n_moveable = self._count_moveable(self.events)
+        self._n_moveable_work = self._count_moveable(self.work_events)
+        self._n_moveable_meetings = self._count_moveable(self.meetings)
+    
+    def _pref_time(self, key, default):
+        """Parse an 'HH:MM' preference into a time object."""
+        return datetime.strptime(self.preferences.get(key, default), '%H:%M').time()
     
-    def _is_past_event(self, event):
-        """Check if an event is in the past (cannot be modified)."""
+    def _prepare_event(self, event):
+        """Shallow copy of an event with its start/end parsed once."""
         start = self._parse_iso(event['start'])
-        return start.date() < self.today
+        end = self._parse_iso(event['end'])
+        prepared = self._timed_event(event, start, end)
+        # Integer sort codes, so sorting compares int tuples instead of hashing strings
+        prepared['_pcode'] = _PRIORITY_ORDER.get(event.get('priority', 'medium'), 1)
+        prepared['_tcode'] = _TYPE_ORDER.get(event.get('type', 'floating'), 2)
+        prepared['_ccode'] = _CATEGORY_ORDER.get(event.get('category', 'Personal'), 4)
+        # Past events cannot be modified - flagged once instead of per check
+        prepared['_past'] = prepared['_date'] < self.today
+        prepared['_pref_window'] = self._parse_preferred_window(event.get('preferred_time'))
+        return prepared
+    
+    @staticmethod
+    def _count_moveable(events):
+        """Number of prepared events that are neither locked nor in the past."""
+        return sum(1 for e in events if not e.get('locked') and not e['_past'])
+    
+    @staticmethod
+    def _get_pref_window(event):
+        """Preferred (start_time, end_time) window cached on a prepared event, or None."""
+        return event.get('_pref_window')
+    
+    @staticmethod
+    def _parse_preferred_window(preferred_time):
+        """
+        Parse an event's preferred_time into a (start_time, end_time) window.
+        
+        Returns:
+            Tuple of time objects, or None if no usable window is enabled
+        """
+        if not (preferred_time and preferred_time.get('enabled')
+                and preferred_time.get('start') and preferred_time.get('end')):
+            return None
+        try:
+            pref_start_time = datetime.strptime(preferred_time['start'], '%H:%M').time()
+            pref_end_time = datetime.strptime(preferred_time['end'], '%H:%M').time()
+        except (ValueError, KeyError):
+            # If preferred time parsing fails, continue without it
+            return None
+        return (pref_start_time, pref_end_time)
+    
+    @staticmethod
+    def _durations_similar(durations):
+        """True if durations (minutes) vary by less than _ROUND_ROBIN_MAX_CV of their mean."""
+        if not durations:
+            return False
+        mean = sum(durations) / len(durations)
+        if mean <= 0:
+            return False
+        variance = sum((d - mean) ** 2 for d in durations) / len(durations)
+        return variance < (_ROUND_ROBIN_MAX_CV * mean) ** 2
+    
+    @staticmethod
+    def _build_tree(events):
+        """Interval tree of prepared events keyed by their [start, end) datetimes."""
+        return IntervalTree((e['_start_dt'], e['_end_dt'], e) for e in events)
+    
+    @staticmethod
+    def _timed_event(event, start, end):
+        """
+        Copy of event with parsed start/end datetimes (and as epoch microseconds),
+        date (and its ordinal) and duration (minutes).
+        """
+        return dict(
+            event,
+            _start_dt=start,
+            _end_dt=end,
+            _start_us=(start - _EPOCH) // _ONE_US,
+            _end_us=(end - _EPOCH) // _ONE_US,
+            _date=start.date(),
+            _day_ord=start.toordinal(),
+            _duration_min=(end - start).total_seconds() / 60
+        )
     
     def smart_optimize_week(self):
         """
@@ -47,10 +215,13 @@ class OptimizationEngine:
         
         ALGORITHM:
         1. Start with locked events in simulation (immovable anchors)
-        2. Sort moveable events by priority/type/category
+        2. Sort moveable events by priority, then longest first (LPT), then type/category
         3. For EACH event:
            a) Calculate total DURATION on each day in simulation
            b) Choose day with LEAST total duration (CRITICAL for workload balancing)
+              - When every day starts with the same locked load and all durations
+                are near-identical, deal days round-robin instead, which gives
+                each day the same share of equal jobs without a search
            c) Find best-fit time slot on that day using:
               - Progressive fallback (preferred time → ±1hr → work hours → full day)
               - Multi-criteria scoring (preferred time match, work hours, spacing, category fit)
@@ -58,28 +229,26 @@ class OptimizationEngine:
         4. Result: Events distributed evenly across days by total hours
         
         WORKLOAD BALANCING GUARANTEE:
-        Line 149: `best_day = min(week_days, key=lambda d: daily_durations[d])`
+        Each event pops the least-loaded day from a min-heap keyed by daily_durations.
         This ensures each event goes to the day with lowest total duration, preventing
         asymmetrical workloads (e.g., prevents 8h Mon + 1h Tue, ensures ~4.5h Mon + 4.5h Tue).
+        The round-robin shortcut only applies when the days start equally loaded and
+        the jobs are interchangeable, where dealing them evenly is the balanced result.
         
         NOTE: Break events no longer exist in the system. Gaps are implicit.
         
         Returns:
             dict with modifications and even workload distribution
         """
-        modifications = []
         recommendations = []
         
-        # Get preferences
-        work_start = datetime.strptime(self.preferences.get('work_start', '09:00'), '%H:%M').time()
-        work_end = datetime.strptime(self.preferences.get('work_end', '18:00'), '%H:%M').time()
-        
-        # Get week date range
-        all_dates = sorted(set(self._parse_iso(e['start']).date() for e in self.events))
-        if not all_dates:
+        # Get week date range. Days are handled as ordinals internally (day index =
+        # ordinal - week_start_ord); week_days keeps the dates for slot searches
+        if not self.events:
             return {'modifications': [], 'recommendations': [], 'message': 'No events to optimize'}
         
-        week_start = all_dates[0]
+        week_start_ord = min(e['_day_ord'] for e in self.events)
+        week_start = date.fromordinal(week_start_ord)
         week_days = [week_start + timedelta(days=i) for i in range(7)]
         
         # Separate events: locked (never move) vs moveable (reschedule)
@@ -87,14 +256,16 @@ class OptimizationEngine:
         locked_events = [e for e in self.events if e.get('locked')]
         
         # CRITICAL: Filter out past events - they cannot be modified
-        moveable_events = [e for e in self.events 
-                          if not e.get('locked') 
-                          and not self._is_past_event(e)]
-        
-        # Track how many events were excluded for being in the past
-        past_events_count = len([e for e in self.events 
-                                if not e.get('locked') 
-                                and self._is_past_event(e)])
+        # (and track how many events were excluded for being in the past)
+        moveable_events = []
+        past_events_count = 0
+        for e in self.events:
+            if e.get('locked'):
+                continue
+            if e['_past']:
+                past_events_count += 1
+            else:
+                moveable_events.append(e)
         
         if not moveable_events:
             msg = 'No moveable events'
@@ -102,147 +273,151 @@ class OptimizationEngine:
                 msg += f' (excluded {past_events_count} past events - cannot modify history)'
             return {'modifications': [], 'recommendations': [], 'message': msg}
         
-        print(f"\n=== WORKLOAD BALANCING START ===")
-        print(f"Total events: {len(self.events)}")
-        print(f"  Locked: {len(locked_events)}")
-        print(f"  Moveable: {len(moveable_events)}")
-        print(f"Target: {len(moveable_events)/7.0:.1f} moveable events/day")
-        
-        # STEP 1: Create simulation with ONLY locked events
-        simulated_schedule = []
-        for event in locked_events:
-            simulated_schedule.append(copy.deepcopy(event))
+        # Get preferences
+        work_start = self._work_start_t
+        work_end = self._work_end_t
         
-        print(f"\nStarting simulation with {len(simulated_schedule)} locked events")
+        # Progress goes to the debug log (formatted lazily - free when disabled)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        logger.debug("Workload balancing: %d events (%d locked, %d moveable), target %.1f moveable events/day",
+                     len(self.events), len(locked_events), len(moveable_events), len(moveable_events) / 7.0)
         
-        # STEP 2: Sort moveable events
-        priority_order = {'high': 0, 'medium': 1, 'low': 2}
-        type_order = {'fixed': 0, 'recurring': 1, 'floating': 2}
-        category_order = {'Work': 0, 'Meeting': 1, 'Recreational': 2, 'Meal': 3, 'Personal': 4}
+        # STEP 1: Create simulation with ONLY locked events
+        # (the simulation never mutates them, so no copies are needed)
+        simulated_schedule = list(locked_events)
+        sim_tree = self._build_tree(simulated_schedule)
+        
+        logger.debug("Starting simulation with %d locked events", len(simulated_schedule))
+        
+        # STEP 2: Sort moveable events by priority, then longest first within a
+        # priority (LPT: placing big jobs first keeps the daily totals even),
+        # then type/category and original time
+        sorted_events = sorted(
+            moveable_events,
+            key=lambda e: (e['_pcode'], -e['_duration_min'], e['_tcode'], e['_ccode'], e['_start_dt'])
+        )
         
-        def sort_key(event):
-            priority = priority_order.get(event.get('priority', 'medium'), 1)
-            event_type = type_order.get(event.get('type', 'floating'), 2)
-            category = category_order.get(event.get('category', 'Personal'), 4)
-            original_time = self._parse_iso(event['start'])
-            return (priority, event_type, category, original_time)
+        # Search start per category code (Work, Meeting, Recreational, Meal, Personal)
+        search_times = (work_start, work_start, _DEFAULT_SEARCH_TIME, _MEAL_SEARCH_TIME, _DEFAULT_SEARCH_TIME)
         
-        sorted_events = sorted(moveable_events, key=sort_key)
+        logger.debug("Scheduling %d events", len(sorted_events))
         
-        print(f"\n=== SCHEDULING {len(sorted_events)} EVENTS ===\n")
+        # CRITICAL FIX: Track TOTAL DURATION on each day, not just event count
+        # (includes both locked events AND already-scheduled moveable events).
+        # Seeded once from the locked events, then bumped as each event is placed
+        # Event counts are kept alongside for the final distribution report.
+        # Both are fixed-size lists indexed by days since week_start
+        daily_durations = [0] * 7  # minutes per day
+        daily_counts = [0] * 7     # events per day
+        for sim_event in simulated_schedule:
+            day_idx = sim_event['_day_ord'] - week_start_ord
+            if 0 <= day_idx < 7:  # Only count events in this week
+                daily_durations[day_idx] += sim_event['_duration_min']
+                daily_counts[day_idx] += 1
+        
+        # Min-heap of (minutes scheduled, day index): equal loads pop the earliest day
+        day_heap = [(load, day_idx) for day_idx, load in enumerate(daily_durations)]
+        heapq.heapify(day_heap)
+        
+        # Days starting equally loaded and near-identical durations: every day
+        # gets about n/7 of them, so deal the days in a fixed order instead of
+        # searching the heap. Uneven locked loads always go through the heap,
+        # so a heavily locked day is not handed its n/7 share regardless
+        round_robin = (len(set(daily_durations)) == 1
+                       and self._durations_similar([e['_duration_min'] for e in sorted_events]))
+        if round_robin:
+            day_order = [day_idx for _, day_idx in sorted(day_heap)]
         
         # STEP 3: Schedule ONE event at a time
+        placements = []  # (event, new_start, new_end, day index, day load before placing)
         for idx, event in enumerate(sorted_events):
-            orig_start = self._parse_iso(event['start'])
-            orig_end = self._parse_iso(event['end'])
-            duration = orig_end - orig_start
+            duration = event['_end_dt'] - event['_start_dt']
             category = event.get('category', 'Personal')
             
-            # CRITICAL FIX: Track TOTAL DURATION on each day, not just event count
-            # (includes both locked events AND already-scheduled moveable events)
-            daily_durations = defaultdict(int)  # minutes per day
-            for sim_event in simulated_schedule:
-                day = self._parse_iso(sim_event['start']).date()
-                if day in week_days:  # Only count events in this week
-                    event_start = self._parse_iso(sim_event['start'])
-                    event_end = self._parse_iso(sim_event['end'])
-                    duration_minutes = (event_end - event_start).total_seconds() / 60
-                    daily_durations[day] += duration_minutes
-            
-            # Initialize days with 0 if not present
-            for day in week_days:
-                if day not in daily_durations:
-                    daily_durations[day] = 0
-            
-            # Find day with LEAST total time scheduled (true workload balancing)
-            best_day = min(week_days, key=lambda d: daily_durations[d])
-            
-            # Time preference by category
-            if category in ['Work', 'Meeting']:
-                search_time = work_start
-            elif category == 'Meal':
-                search_time = datetime.strptime('12:00', '%H:%M').time()
+            # Find day with LEAST total time scheduled (true workload balancing).
+            # Entries whose load no longer matches daily_durations are stale - skip them
+            if round_robin:
+                day_idx = day_order[idx % 7]
             else:
-                search_time = datetime.strptime('14:00', '%H:%M').time()
-            
-            search_start = datetime.combine(best_day, search_time)
-            
-            # Extract preferred time window if event has one
-            preferred_time_window = None
-            preferred_time = event.get('preferred_time', {})
-            if preferred_time and preferred_time.get('enabled') and preferred_time.get('start') and preferred_time.get('end'):
-                try:
-                    pref_start_str = preferred_time['start']
-                    pref_end_str = preferred_time['end']
-                    pref_start_time = datetime.strptime(pref_start_str, '%H:%M').time()
-                    pref_end_time = datetime.strptime(pref_end_str, '%H:%M').time()
-                    preferred_time_window = (pref_start_time, pref_end_time)
-                except (ValueError, KeyError):
-                    # If preferred time parsing fails, continue without it
-                    pass
+                while True:
+                    load, day_idx = heapq.heappop(day_heap)
+                    if load == daily_durations[day_idx]:
+                        break
+            best_day = week_days[day_idx]
             
-            # Find available slot using simulation
-            old_events = self.events
-            self.events = simulated_schedule
+            # Time preference by category
+            search_start = datetime.combine(best_day, search_times[event['_ccode']])
             
+            # Find available slot against the simulated schedule
             available_slot = self._find_next_available_slot(
                 search_start, duration, best_day, work_start, work_end, event['id'],
                 event_category=category, event_priority=event.get('priority', 'medium'),
-                preferred_time_window=preferred_time_window
+                preferred_time_window=self._get_pref_window(event),
+                tree=sim_tree
             )
             
-            self.events = old_events
-            
             if available_slot:
                 new_start = available_slot
                 new_end = available_slot + duration
                 
-                # Always add modification (we're rescheduling everything)
-                modifications.append({
-                    'id': event['id'],
-                    'title': event['title'],
-                    'old_start': event['start'],
-                    'old_end': event['end'],
-                    'new_start': new_start.isoformat(),
-                    'new_end': new_end.isoformat(),
-                    'reason': f'{category} ({best_day.strftime("%a")} had {daily_durations[best_day]:.0f}min scheduled)'
-                })
+                # Always add modification (we're rescheduling everything);
+                # serialized in one pass after the loop
+                placements.append((event, new_start, new_end, day_idx, daily_durations[day_idx]))
                 
-                # Add to simulation
-                simulated_schedule.append({
+                # Add to simulation (times stay parsed; only modifications are serialized)
+                sim_event = self._timed_event({
                     'id': event['id'],
                     'title': event['title'],
-                    'start': new_start.isoformat(),
-                    'end': new_end.isoformat(),
                     'category': category,
                     'priority': event.get('priority'),
                     'type': event.get('type'),
                     'locked': False
-                })
+                }, new_start, new_end)
+                sim_tree.insert((new_start, new_end), sim_event)
+                
+                if debug and ((idx + 1) <= 5 or (idx + 1) % 10 == 0):
+                    durations_str = f"[{','.join(f'{minutes:.0f}' for minutes in daily_durations)}]"
+                    logger.debug("[%2d/%d] %-30s → %-3s %s durations(min):%s chose:%.0f→%.0f",
+                                 idx + 1, len(sorted_events), event['title'], best_day.strftime('%a'),
+                                 new_start.strftime('%H:%M'), durations_str, daily_durations[day_idx],
+                                 daily_durations[day_idx] + duration.total_seconds() / 60)
                 
-                if (idx + 1) <= 5 or (idx + 1) % 10 == 0:
-                    durations_str = f"[{','.join(f'{daily_durations[d]:.0f}' for d in week_days)}]"
-                    print(f"[{idx+1:2d}/{len(sorted_events)}] {event['title']:30s} → {best_day.strftime('%a'):3s} {new_start.strftime('%H:%M')} durations(min):{durations_str} chose:{daily_durations[best_day]:.0f}→{daily_durations[best_day]+(duration.total_seconds()/60):.0f}")
+                # Credit the day the slot actually starts on (an inverted event's
+                # slot can run past midnight) and refresh that day's heap entry
+                placed_idx = new_start.toordinal() - week_start_ord
+                if 0 <= placed_idx < 7:
+                    daily_durations[placed_idx] += duration.total_seconds() / 60
+                    daily_counts[placed_idx] += 1
+                    if placed_idx != day_idx and not round_robin:
+                        heapq.heappush(day_heap, (daily_durations[placed_idx], placed_idx))
+            
+            if not round_robin:
+                heapq.heappush(day_heap, (daily_durations[day_idx], day_idx))
+        
+        # Emit the modifications from the recorded placements
+        day_names = [day.strftime('%a') for day in week_days]
+        modifications = [
+            {
+                'id': event['id'],
+                'title': event['title'],
+                'old_start': event['start'],
+                'old_end': event['end'],
+                'new_start': new_start.isoformat(),
+                'new_end': new_end.isoformat(),
+                'reason': f'{event.get("category", "Personal")} ({day_names[day_idx]} had {load:.0f}min scheduled)'
+            }
+            for event, new_start, new_end, day_idx, load in placements
+        ]
         
         # Show final distribution
-        print(f"\n=== FINAL DISTRIBUTION ===")
-        final_durations = defaultdict(int)  # Track total duration per day
-        final_counts = defaultdict(int)     # Track event count per day
-        for sim_event in simulated_schedule:
-            day = self._parse_iso(sim_event['start']).date()
-            if day in week_days:
-                final_counts[day] += 1
-                # Calculate duration
-                start = self._parse_iso(sim_event['start'])
-                end = self._parse_iso(sim_event['end'])
-                duration_min = (end - start).total_seconds() / 60
-                final_durations[day] += duration_min
-        
-        for day in week_days:
-            count = final_counts[day]
-            duration_hours = final_durations[day] / 60
-            bar = "█" * int(duration_hours)  # Bar represents hours
-            print(f"{day.strftime('%A'):10s} [{count:2d} events, {duration_hours:5.1f}h] {bar}")
+        # (the running totals already cover every simulated event - no re-scan)
+        if debug:
+            logger.debug("Final distribution:")
+            for day_idx, day in enumerate(week_days):
+                duration_hours = daily_durations[day_idx] / 60
+                bar = "█" * int(duration_hours)  # Bar represents hours
+                logger.debug("%-10s [%2d events, %5.1fh] %s",
+                             day.strftime('%A'), daily_counts[day_idx], duration_hours, bar)
         
         # NOTE: Breaks were completely removed as events. No break deletion needed.
         # The system no longer uses break events (neither physical nor virtual).
@@ -266,26 +441,32 @@ class OptimizationEngine:
         """
         modifications = []
         
+        if not self.events:
+            return {'modifications': [], 'message': 'No events to optimize'}
+        if self._n_moveable < 2:
+            # Nothing can be grouped with fewer than two moveable events
+            return {
+                'modifications': [],
+                'events_modified': 0,
+                'improvement_estimate': self._estimate_fragmentation_improvement(0)
+            }
+        
         # Get working hours from preferences
-        work_start = datetime.strptime(self.preferences.get('work_start', '09:00'), '%H:%M').time()
-        work_end = datetime.strptime(self.preferences.get('work_end', '18:00'), '%H:%M').time()
+        work_start = self._work_start_t
+        work_end = self._work_end_t
         
         # Group events by category
         events_by_category = defaultdict(list)
         for event in self.events:
             if event.get('locked') or event.get('title') == 'Break':
                 continue  # Skip locked events and breaks
-            if self._is_past_event(event):
+            if event['_past']:
                 continue  # CRITICAL: Skip past events - cannot modify history
             category = event.get('category', 'Personal')
             events_by_category[category].append(event)
         
-        # Get date range for the week
-        all_dates = sorted(set(self._parse_iso(e['start']).date() for e in self.events))
-        if not all_dates:
-            return {'modifications': [], 'message': 'No events to optimize'}
-        
-        week_start = all_dates[0]
+        # Get date range for the week (starts on the earliest event's date)
+        week_start = min(e['_date'] for e in self.events)
         week_days = [week_start + timedelta(days=i) for i in range(7)]
         
         # For each category, distribute events across the week intelligently
@@ -298,7 +479,7 @@ class OptimizationEngine:
             events_per_day = max(1, len(category_events) // 5)  # Spread across workweek
             
             # Sort events by current time
-            category_events.sort(key=lambda e: self._parse_iso(e['start']))
+            category_events.sort(key=lambda e: e['_start_dt'])
             
             # Try to schedule events in batches per day
             day_index = 0
@@ -306,8 +487,8 @@ class OptimizationEngine:
             current_time = datetime.combine(week_days[day_index], work_start)
             
             for event in category_events:
-                start = self._parse_iso(event['start'])
-                duration = self._parse_iso(event['end']) - start
+                start = event['_start_dt']
+                duration = event['_end_dt'] - start
                 
                 # Check if we should move to next day
                 if events_scheduled_today >= events_per_day or current_time.time() > work_end:
@@ -317,19 +498,6 @@ class OptimizationEngine:
                     current_time = datetime.combine(week_days[day_index], work_start)
                     events_scheduled_today = 0
                 
-                # Extract preferred time window if event has one
-                preferred_time_window = None
-                preferred_time = event.get('preferred_time', {})
-                if preferred_time and preferred_time.get('enabled') and preferred_time.get('start') and preferred_time.get('end'):
-                    try:
-                        pref_start_str = preferred_time['start']
-                        pref_end_str = preferred_time['end']
-                        pref_start_time = datetime.strptime(pref_start_str, '%H:%M').time()
-                        pref_end_time = datetime.strptime(pref_end_str, '%H:%M').time()
-                        preferred_time_window = (pref_start_time, pref_end_time)
-                    except (ValueError, KeyError):
-                        pass
-                
                 # Find next available slot on current day
                 new_start = self._find_next_available_slot(
                     current_time, 
@@ -340,7 +508,7 @@ class OptimizationEngine:
                     event['id'],
                     event_category=category,
                     event_priority=event.get('priority', 'medium'),
-                    preferred_time_window=preferred_time_window
+                    preferred_time_window=self._get_pref_window(event)
                 )
                 
                 if new_start and new_start.date() == week_days[day_index]:
@@ -381,15 +549,22 @@ class OptimizationEngine:
         modifications = []
         MAX_CONTINUOUS_WORK_MINUTES = 240  # 4 hours
         
+        if self._n_moveable_work < 2:
+            # A block needs at least two moveable work events
+            return {
+                'modifications': [],
+                'events_modified': 0,
+                'improvement_estimate': self._estimate_block_improvement(0)
+            }
+        
         # Group work events by day
         work_by_day = defaultdict(list)
         for event in self.work_events:
             if event.get('locked') or event.get('title') == 'Break':
                 continue
-            if self._is_past_event(event):
+            if event['_past']:
                 continue  # CRITICAL: Skip past events - cannot modify history
-            start = self._parse_iso(event['start'])
-            work_by_day[start.date()].append(event)
+            work_by_day[event['_date']].append(event)
         
         # For each day, try to create deep work blocks
         for day, day_events in work_by_day.items():
@@ -397,32 +572,25 @@ class OptimizationEngine:
                 continue
             
             # Sort by start time
-            day_events.sort(key=lambda e: self._parse_iso(e['start']))
+            day_events.sort(key=lambda e: e['_start_dt'])
             
-            # Build deep work blocks, respecting max continuous work time
-            i = 0
-            while i < len(day_events) - 1:
-                current = day_events[i]
-                next_event = day_events[i + 1]
-                
-                current_start = self._parse_iso(current['start'])
-                current_end = self._parse_iso(current['end'])
-                next_start = self._parse_iso(next_event['start'])
-                next_end = self._parse_iso(next_event['end'])
+            # Build deep work blocks, respecting max continuous work time.
+            # One pass over adjacent pairs, reading the times cached in __init__
+            for current, next_event in zip(day_events, day_events[1:]):
+                current_end = current['_end_dt']
+                next_start = next_event['_start_dt']
                 
                 gap = (next_start - current_end).total_seconds() / 60
-                current_duration = (current_end - current_start).total_seconds() / 60
-                next_duration = (next_end - next_start).total_seconds() / 60
                 
                 # Check if merging would exceed max continuous work time
-                combined_duration = current_duration + next_duration
+                combined_duration = current['_duration_min'] + next_event['_duration_min']
                 
                 # If gap < 60 min and combined duration < 240 min, merge by moving next event closer
+                # (a gap of 60+ min is already a natural break between work blocks)
                 if 0 < gap < 60 and combined_duration < MAX_CONTINUOUS_WORK_MINUTES:
                     # Move next event to start right after current (with small 5 min buffer)
                     new_start = current_end + timedelta(minutes=5)
-                    duration = next_end - next_start
-                    new_end = new_start + duration
+                    new_end = new_start + (next_event['_end_dt'] - next_start)
                     
                     # Ensure no conflicts
                     if self._has_no_conflicts(new_start, new_end, next_event['id']):
@@ -435,11 +603,6 @@ class OptimizationEngine:
                             'new_end': new_end.isoformat(),
                             'reason': f'Creating deep work block (closing {int(gap)} min gap, total: {int(combined_duration)} min)'
                         })
-                elif gap >= 60:
-                    # Gap is already good - this is a natural break between work blocks
-                    pass
-                
-                i += 1
         
         return {
             'modifications': modifications,
@@ -459,8 +622,8 @@ class OptimizationEngine:
         """
         modifications = []
         
-        # Sort meetings by start time
-        meetings_sorted = sorted(self.meetings, key=lambda x: self._parse_iso(x['start']))
+        # Meetings by start time (sorted once in __init__)
+        meetings_sorted = self._meetings_sorted
         
         if len(meetings_sorted) < 2:
             return {
@@ -468,20 +631,25 @@ class OptimizationEngine:
                 'message': 'No back-to-back meetings to optimize'
             }
         
+        if self._n_moveable_meetings < 2:
+            # Only pairs of moveable meetings are ever shifted
+            return {
+                'modifications': [],
+                'events_modified': 0,
+                'improvement_estimate': {'meeting_efficiency': 0}
+            }
+        
         # Find back-to-back meetings (gap < 10 minutes)
-        for i in range(len(meetings_sorted) - 1):
-            current = meetings_sorted[i]
-            next_meeting = meetings_sorted[i + 1]
-            
+        for current, next_meeting in zip(meetings_sorted, meetings_sorted[1:]):
             if current.get('locked') or next_meeting.get('locked'):
                 continue
             
             # CRITICAL: Skip past events - cannot modify history
-            if self._is_past_event(current) or self._is_past_event(next_meeting):
+            if current['_past'] or next_meeting['_past']:
                 continue
             
-            current_end = self._parse_iso(current['end'])
-            next_start = self._parse_iso(next_meeting['start'])
+            current_end = current['_end_dt']
+            next_start = next_meeting['_start_dt']
             
             gap_minutes = (next_start - current_end).total_seconds() / 60
             
@@ -489,7 +657,7 @@ class OptimizationEngine:
             if 0 <= gap_minutes < 10:
                 buffer_needed = 10 - gap_minutes
                 new_start = next_start + timedelta(minutes=buffer_needed)
-                duration = self._parse_iso(next_meeting['end']) - next_start
+                duration = next_meeting['_end_dt'] - next_start
                 new_end = new_start + duration
                 
                 # Check if new time slot is free - if not, try to find next available slot
@@ -505,32 +673,16 @@ class OptimizationEngine:
                     })
                 else:
                     # Try to find next available slot after the desired buffer time
-                    work_start = datetime.strptime(self.preferences.get('work_start', '09:00'), '%H:%M').time()
-                    work_end = datetime.strptime(self.preferences.get('work_end', '18:00'), '%H:%M').time()
-                    
-                    # Extract preferred time window if event has one
-                    preferred_time_window = None
-                    preferred_time = next_meeting.get('preferred_time', {})
-                    if preferred_time and preferred_time.get('enabled') and preferred_time.get('start') and preferred_time.get('end'):
-                        try:
-                            pref_start_str = preferred_time['start']
-                            pref_end_str = preferred_time['end']
-                            pref_start_time = datetime.strptime(pref_start_str, '%H:%M').time()
-                            pref_end_time = datetime.strptime(pref_end_str, '%H:%M').time()
-                            preferred_time_window = (pref_start_time, pref_end_time)
-                        except (ValueError, KeyError):
-                            pass
-                    
                     available_slot = self._find_next_available_slot(
                         new_start,
                         duration,
                         new_start.date(),
-                        work_start,
-                        work_end,
+                        self._work_start_t,
+                        self._work_end_t,
                         next_meeting['id'],
                         event_category='Meeting',
                         event_priority=next_meeting.get('priority', 'medium'),
-                        preferred_time_window=preferred_time_window
+                        preferred_time_window=self._get_pref_window(next_meeting)
                     )
                     
                     if available_slot:
@@ -562,29 +714,29 @@ class OptimizationEngine:
         """
         recommendations = []
         
+        if self._n_moveable_meetings < 3:
+            # No day can reach the 3-meeting threshold
+            return {'modifications': [], 'recommendations': [], 'improvement_estimate': {}}
+        
         # Group meetings by day
         meetings_by_day = defaultdict(list)
         for meeting in self.meetings:
             if meeting.get('locked'):
                 continue
-            if self._is_past_event(meeting):
+            if meeting['_past']:
                 continue  # CRITICAL: Skip past events - cannot modify history
-            start = self._parse_iso(meeting['start'])
-            meetings_by_day[start.date()].append(meeting)
+            meetings_by_day[meeting['_date']].append(meeting)
         
         # Find days with excessive meetings
         for day, day_meetings in meetings_by_day.items():
             if len(day_meetings) >= 3:
                 # Suggest consolidating meetings on this day
-                total_meeting_mins = sum(
-                    (self._parse_iso(m['end']) - self._parse_iso(m['start'])).total_seconds() / 60
-                    for m in day_meetings
-                )
+                total_meeting_mins = sum(m['_duration_min'] for m in day_meetings)
                 
                 # Find shortest meetings (candidates for combination)
                 short_meetings = sorted(
                     day_meetings,
-                    key=lambda m: (self._parse_iso(m['end']) - self._parse_iso(m['start'])).total_seconds() / 60
+                    key=lambda m: m['_duration_min']
                 )[:3]
                 
                 if len(short_meetings) >= 2:
@@ -614,8 +766,7 @@ class OptimizationEngine:
         """
         # Calculate current recreational time
         recreational_minutes = sum(
-            (self._parse_iso(e['end']) - self._parse_iso(e['start'])).total_seconds() / 60
-            for e in self.recreational + self.personal_events
+            e['_duration_min'] for e in self.recreational + self.personal_events
         )
         
         target_minutes = 10 * 60  # 10 hours
@@ -631,29 +782,28 @@ class OptimizationEngine:
         modifications = []
         recommendations = []
         
-        # Find excessively long work events (> 3 hours)
+        # Find excessively long work events (> 3 hours), as a max-heap on
+        # duration; the position keeps equal durations in schedule order
         long_work_events = []
-        for event in self.work_events + self.meetings:
+        for position, event in enumerate(self._work_and_meetings):
             if event.get('locked'):
                 continue
-            if self._is_past_event(event):
+            if event['_past']:
                 continue  # CRITICAL: Skip past events - cannot modify history
-            start = self._parse_iso(event['start'])
-            end = self._parse_iso(event['end'])
-            duration_minutes = (end - start).total_seconds() / 60
+            duration_minutes = event['_duration_min']
             
             if duration_minutes >= 180:  # 3+ hours
-                long_work_events.append((event, duration_minutes))
-        
-        # Sort by duration (longest first) to reduce the biggest blocks
-        long_work_events.sort(key=lambda x: x[1], reverse=True)
-        
-        for event, duration_minutes in long_work_events:
-            if deficit_minutes <= 0:
-                break
+                long_work_events.append((-duration_minutes, position, event))
+        
+        # Longest first to reduce the biggest blocks. Covering the deficit
+        # usually takes only a few, so pop them lazily instead of sorting all
+        heapq.heapify(long_work_events)
+        while long_work_events and deficit_minutes > 0:
+            neg_duration, _, event = heapq.heappop(long_work_events)
+            duration_minutes = -neg_duration
             
-            start = self._parse_iso(event['start'])
-            end = self._parse_iso(event['end'])
+            start = event['_start_dt']
+            end = event['_end_dt']
             
             # Reduce by min(30 min, deficit_needed)
             reduction = min(30, deficit_minutes)
@@ -705,15 +855,12 @@ class OptimizationEngine:
             dict with modifications to move conflicting events
         """
         modifications = []
-        sleep_start_str = self.preferences.get('sleep_start', '23:00')
-        sleep_end_str = self.preferences.get('sleep_end', '07:00')
-        work_start_str = self.preferences.get('work_start', '09:00')
-        work_end_str = self.preferences.get('work_end', '18:00')
         
-        sleep_start = datetime.strptime(sleep_start_str, '%H:%M').time()
-        sleep_end = datetime.strptime(sleep_end_str, '%H:%M').time()
-        work_start = datetime.strptime(work_start_str, '%H:%M').time()
-        work_end = datetime.strptime(work_end_str, '%H:%M').time()
+        if not self._n_moveable:
+            return {'modifications': [], 'events_modified': 0, 'improvement_estimate': {}}
+        
+        work_start = self._work_start_t
+        work_end = self._work_end_t
         
         # Find events during sleep hours
         for event in self.events:
@@ -721,30 +868,20 @@ class OptimizationEngine:
                 continue
             
             # CRITICAL: Skip past events - cannot modify history
-            if self._is_past_event(event):
+            if event['_past']:
                 continue
             
-            start = self._parse_iso(event['start'])
-            end = self._parse_iso(event['end'])
-            duration = end - start
+            start = event['_start_dt']
+            duration = event['_end_dt'] - start
             
-            if self._is_during_sleep(start, sleep_start, sleep_end):
+            if self._is_during_sleep(start):
                 # Try to find next available slot after wake time
                 # Start searching from work start time (more reasonable than wake time)
                 search_start = start.replace(hour=work_start.hour, minute=work_start.minute)
                 
-                # Extract preferred time window if event has one
-                preferred_time_window = None
-                preferred_time = event.get('preferred_time', {})
-                if preferred_time and preferred_time.get('enabled') and preferred_time.get('start') and preferred_time.get('end'):
-                    try:
-                        pref_start_str = preferred_time['start']
-                        pref_end_str = preferred_time['end']
-                        pref_start_time = datetime.strptime(pref_start_str, '%H:%M').time()
-                        pref_end_time = datetime.strptime(pref_end_str, '%H:%M').time()
-                        preferred_time_window = (pref_start_time, pref_end_time)
-                    except (ValueError, KeyError):
-                        pass
+                # Preferred time window if event has one (parsed once at
+                # construction; shared by the next-day fallback below)
+                preferred_time_window = self._get_pref_window(event)
                 
                 available_slot = self._find_next_available_slot(
                     search_start,
@@ -773,19 +910,6 @@ class OptimizationEngine:
                     next_day = start.date() + timedelta(days=1)
                     search_start_next = datetime.combine(next_day, work_start)
                     
-                    # Extract preferred time window if event has one (reuse from above)
-                    preferred_time_window = None
-                    preferred_time = event.get('preferred_time', {})
-                    if preferred_time and preferred_time.get('enabled') and preferred_time.get('start') and preferred_time.get('end'):
-                        try:
-                            pref_start_str = preferred_time['start']
-                            pref_end_str = preferred_time['end']
-                            pref_start_time = datetime.strptime(pref_start_str, '%H:%M').time()
-                            pref_end_time = datetime.strptime(pref_end_str, '%H:%M').time()
-                            preferred_time_window = (pref_start_time, pref_end_time)
-                        except (ValueError, KeyError):
-                            pass
-                    
                     available_slot = self._find_next_available_slot(
                         search_start_next,
                         duration,
@@ -817,31 +941,39 @@ class OptimizationEngine:
     
     # Helper methods
     
-    def _parse_iso(self, iso_string):
-        """Parse ISO datetime string."""
+    @staticmethod
+    @lru_cache(maxsize=_PARSE_CACHE_SIZE)
+    def _parse_iso(iso_string):
+        """
+        Parse ISO datetime string (a trailing Z is dropped so datetimes stay naive).
+        Only used to prepare events - everything else reads the cached times.
+        Memoized, since datetimes are immutable and schedules are re-sent whole.
+        """
         if isinstance(iso_string, datetime):
             return iso_string
         if 'T' in iso_string:
-            return datetime.fromisoformat(iso_string.replace('Z', ''))
+            iso_string = iso_string.replace('Z', '')
         return datetime.fromisoformat(iso_string)
     
-    def _has_no_conflicts(self, start, end, exclude_id=None):
-        """Check if time slot has no conflicts with existing events."""
-        for event in self.events:
-            if event['id'] == exclude_id:
-                continue
-            event_start = self._parse_iso(event['start'])
-            event_end = self._parse_iso(event['end'])
-            
-            # Check overlap: two events overlap if one starts before the other ends
-            # Events overlap if: start1 < end2 AND end1 > start2
-            if start < event_end and end > event_start:
+    def _has_no_conflicts(self, start, end, exclude_id=None, tree=None):
+        """
+        Check if time slot has no conflicts with existing events.
+        
+        tree defaults to the index over self.events; pass another (e.g. a
+        simulated schedule's) to check against that instead.
+        """
+        if tree is None:
+            tree = self._tree
+        # The tree only returns events overlapping the slot:
+        # event start < end AND event end > start
+        for event in tree.query(start, end):
+            if event['id'] != exclude_id:
                 return False
         return True
     
-    def _find_all_available_slots(self, target_date, duration, work_start, work_end, exclude_id=None):
+    def _find_all_available_slots(self, target_date, duration, work_start, work_end, exclude_id=None, tree=None):
         """
-        Find ALL available slots on a specific date.
+        Find ALL available slots on a specific date (15-minute grid from work_start).
         
         Args:
             target_date: Date to search on
@@ -849,121 +981,189 @@ class OptimizationEngine:
             work_start: Start of work day (time object)
             work_end: End of work day (time object)
             exclude_id: Event ID to exclude from conflict checking
+            tree: Interval tree to check conflicts against (defaults to the index over self.events)
             
         Returns:
             List of (start, end) datetime tuples
         """
+        # A slot longer than the window never fits (windows do not wrap past
+        # midnight), so skip the setup
+        if duration // _ONE_US > self._time_us(work_end) - self._time_us(work_start):
+            return []
+        
+        if tree is None:
+            # self.events never changes, so its blocked runs are memoized:
+            # searches for the same day, duration and window share one tree query
+            key = (target_date, duration, work_start, work_end)
+            blocked = self._blocked_cache.get(key)
+            if blocked is None:
+                blocked = self._blocked_cache[key] = self._blocked_runs(
+                    target_date, duration, work_start, work_end, self._tree)
+        else:
+            blocked = self._blocked_runs(target_date, duration, work_start, work_end, tree)
+        search_start, n_slots, runs = blocked
+        
+        # Bitset of grid points whose slot conflicts with an event
+        busy = 0
+        for event_id, run in runs:
+            if event_id != exclude_id:
+                busy |= run
+        
+        # Enumerate the free grid points, lowest bit (earliest slot) first
+        free = ~busy & ((1 << n_slots) - 1)
         slots = []
+        while free:
+            low = free & -free
+            slot_start = search_start + _SLOT_STEP * (low.bit_length() - 1)
+            slots.append((slot_start, slot_start + duration))
+            free ^= low
+        
+        return slots
+    
+    @staticmethod
+    def _time_us(t):
+        """Microseconds since midnight for a time object."""
+        return ((t.hour * 60 + t.minute) * 60 + t.second) * 1000000 + t.microsecond
+    
+    @staticmethod
+    def _blocked_runs(target_date, duration, work_start, work_end, tree):
+        """
+        Grid points blocked by each event, for _find_all_available_slots.
+        
+        Returns:
+            (search_start, n_slots, runs): grid point i is the slot
+            [search_start + i*step, ... + duration), the first n_slots of them end
+            by work_end, and runs holds an (event id, bitmask) pair per event
+            with the bits of the grid points whose slot conflicts with it
+        """
         search_start = datetime.combine(target_date, work_start)
         work_end_dt = datetime.combine(target_date, work_end)
         
-        current = search_start
-        while current + duration <= work_end_dt:
-            slot_end = current + duration
-            if self._has_no_conflicts(current, slot_end, exclude_id):
-                slots.append((current, slot_end))
-            current += timedelta(minutes=15)
-        
-        return slots
+        room = work_end_dt - duration - search_start
+        if room < timedelta(0):
+            return search_start, 0, []
+        n_slots = room // _SLOT_STEP + 1
+        
+        # An event [start, end) blocks the slots starting after start - duration
+        # and before end: one contiguous run of bits
+        search_start_us = (search_start - _EPOCH) // _ONE_US
+        duration_us = duration // _ONE_US
+        runs = []
+        for event in tree.query(search_start, work_end_dt):
+            first = (event['_start_us'] - duration_us - search_start_us) // _SLOT_STEP_US + 1
+            last = -((search_start_us - event['_end_us']) // _SLOT_STEP_US) - 1
+            first = max(first, 0)
+            last = min(last, n_slots - 1)
+            if first <= last:
+                runs.append((event['id'], ((1 << (last - first + 1)) - 1) << first))
+        return search_start, n_slots, runs
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _work_window_for_date(slot_date, work_start, work_end):
+        """Work day (start, end, center) datetimes on a date (memoized; datetimes are immutable)."""
+        work_start_dt = datetime.combine(slot_date, work_start)
+        work_end_dt = datetime.combine(slot_date, work_end)
+        return work_start_dt, work_end_dt, work_start_dt + (work_end_dt - work_start_dt) / 2
     
-    def _score_slot(self, slot_start, slot_end, event_category, event_priority, exclude_id=None):
+    def _score_slots(self, slots, event_category, event_priority, exclude_id=None, tree=None):
         """
-        Score a time slot based on optimality criteria.
+        Score a batch of time slots based on optimality criteria.
         
         Higher score = better slot
         
         Scoring factors:
         - Time of day fit for category (Work→morning, Personal→evening, etc.)
         - Centrality within work hours
-        - Spacing from other events
+        - Spacing from other events (counted in tree, defaulting to the index over self.events)
+        
+        The events near any of the slots are fetched with one tree query for
+        the whole batch, instead of one query per slot.
+        
+        Args:
+            slots: List of (start, end) datetime tuples, in start order
+            event_category: Event category for time-of-day fit
+            event_priority: Event priority
+            exclude_id: Event ID to ignore when counting nearby events
+            tree: Interval tree to count nearby events in
+            
+        Returns:
+            List of scores, one per slot
         """
-        score = 0
-        slot_hour = slot_start.hour
-        slot_date = slot_start.date()
-        
-        # 1. TIME OF DAY FIT (0-50 points)
-        if event_category in ['Work', 'Meeting']:
-            # Work/meetings prefer morning-midday (9-14)
-            if 9 <= slot_hour <= 14:
-                score += 50
-            elif 14 < slot_hour <= 17:
-                score += 30  # Afternoon is OK
-            else:
-                score += 10  # Early morning or late
-        elif event_category in ['Personal', 'Recreational']:
-            # Personal prefers afternoon-evening (14-20)
-            if 14 <= slot_hour <= 20:
-                score += 50
-            elif 12 <= slot_hour < 14 or 20 < slot_hour <= 22:
-                score += 30  # Close to ideal
-            else:
-                score += 10
-        elif event_category == 'Meal':
-            # Meals prefer standard meal times
-            if slot_hour in [7, 8, 12, 13, 18, 19]:  # Breakfast, lunch, dinner times
-                score += 50
-            elif slot_hour in [6, 9, 11, 14, 17, 20]:  # Close to meal times
-                score += 30
-            else:
-                score += 10
-        else:
-            # Default: prefer work hours
-            if 9 <= slot_hour <= 17:
-                score += 30
-            else:
-                score += 10
-        
-        # 2. WORK HOUR CENTRALITY (0-30 points)
-        # Prefer slots in middle of workday to avoid edge effects
-        work_start_dt = datetime.combine(slot_date, datetime.strptime(
-            self.preferences.get('work_start', '09:00'), '%H:%M').time())
-        work_end_dt = datetime.combine(slot_date, datetime.strptime(
-            self.preferences.get('work_end', '18:00'), '%H:%M').time())
-        
-        if slot_start >= work_start_dt and slot_end <= work_end_dt:
-            work_center = work_start_dt + (work_end_dt - work_start_dt) / 2
-            slot_center = slot_start + (slot_end - slot_start) / 2
-            distance_hours = abs((slot_center - work_center).total_seconds()) / 3600
-            centrality_score = max(0, 30 - (distance_hours * 5))
-            score += centrality_score
-        
-        # 3. SPACING FROM OTHER EVENTS (0-20 points)
-        # Count events within 2 hours before/after
-        nearby_events = 0
-        for event in self.events:
-            if event.get('id') == exclude_id:
-                continue
-            event_start = self._parse_iso(event['start'])
-            event_end = self._parse_iso(event['end'])
+        if not slots:
+            return []
+        if tree is None:
+            tree = self._tree
+        
+        # Only events overlapping a slot widened by 2 hours (plus any inversion)
+        # can count as nearby, so one query over the widened batch span covers all
+        reach = _NEARBY_WINDOW + self._max_inversion
+        batch_lo = min(min(slot_start, slot_end) for slot_start, slot_end in slots) - reach
+        batch_hi = max(max(slot_start, slot_end) for slot_start, slot_end in slots) + reach
+        reach_us = reach // _ONE_US
+        nearby_starts = []
+        nearby_ends = []
+        for event in tree.query(batch_lo, batch_hi):
+            if event.get('id') != exclude_id:
+                nearby_starts.append(event['_start_us'])
+                nearby_ends.append(event['_end_us'])
+        
+        hour_scores = _TIME_OF_DAY_SCORES.get(event_category, _DEFAULT_HOUR_SCORES)
+        scores = []
+        for slot_start, slot_end in slots:
+            score = 0
             
-            # Check if event is within 2 hours of this slot
-            time_diff = min(
-                abs((event_start - slot_end).total_seconds()),
-                abs((event_end - slot_start).total_seconds())
-            ) / 3600
+            # 1. TIME OF DAY FIT (0-50 points)
+            score += hour_scores[slot_start.hour]
             
-            if time_diff < 2:
-                nearby_events += 1
-        
-        # Prefer slots with fewer nearby events (less cramming)
-        spacing_score = max(0, 20 - (nearby_events * 5))
-        score += spacing_score
+            # 2. WORK HOUR CENTRALITY (0-30 points)
+            # Prefer slots in middle of workday to avoid edge effects
+            work_start_dt, work_end_dt, work_center = self._work_window_for_date(
+                slot_start.date(), self._work_start_t, self._work_end_t)
+            
+            if slot_start >= work_start_dt and slot_end <= work_end_dt:
+                slot_center = slot_start + (slot_end - slot_start) / 2
+                distance_hours = abs((slot_center - work_center).total_seconds()) / 3600
+                centrality_score = max(0, 30 - (distance_hours * 5))
+                score += centrality_score
+            
+            # 3. SPACING FROM OTHER EVENTS (0-20 points)
+            # Count events within 2 hours before/after. Events starting past the
+            # slot's widened end cannot qualify, and the candidates are in start order
+            slot_start_us = (slot_start - _EPOCH) // _ONE_US
+            slot_end_us = (slot_end - _EPOCH) // _ONE_US
+            cutoff = bisect_left(nearby_starts, max(slot_start_us, slot_end_us) + reach_us)
+            nearby_events = 0
+            for k in range(cutoff):
+                if (abs(nearby_starts[k] - slot_end_us) < _NEARBY_WINDOW_US
+                        or abs(nearby_ends[k] - slot_start_us) < _NEARBY_WINDOW_US):
+                    nearby_events += 1
+            
+            # Prefer slots with fewer nearby events (less cramming)
+            spacing_score = max(0, 20 - (nearby_events * 5))
+            score += spacing_score
+            
+            scores.append(score)
         
-        return score
+        return scores
     
-    def _find_next_available_slot(self, preferred_start, duration, target_date, work_start, work_end, exclude_id=None, event_category=None, event_priority=None, preferred_time_window=None):
+    def _find_next_available_slot(self, preferred_start, duration, target_date, work_start, work_end, exclude_id=None, event_category=None, event_priority=None, preferred_time_window=None, tree=None):
         """
         Find BEST-FIT time slot on target_date using multi-criteria scoring with progressive fallback.
         
         STRATEGY (matches recurring/floating event logic):
-        1. Collect ALL candidate slots across 4 fallback levels:
-           - Level 1: Exact preferred time window (if specified)
-           - Level 2: Expanded preferred time (±1 hour)
-           - Level 3: Work hours (full work day)
-           - Level 4: Any waking hours (last resort)
-        2. Score ALL candidates using _score_slot() (work hours, spacing, centrality)
-        3. Add preferred time bonus (50 points) for slots in exact/expanded window
-        4. Return HIGHEST-SCORING slot (not first-fit)
+        1. Enumerate the free slots once per window grid (15-min steps) and merge them:
+           - Preferred grid (through the preferred start) within the expanded window
+           - Work grid (through work_start) within work hours
+           - Midnight grid across the whole day
+        2. Give each slot the bonus of the best window it fits in:
+           - Exact preferred time window (if specified): +50
+           - Expanded preferred time (±1 hour): +35
+           - Work hours (full work day): +10
+           - Any other time of day (last resort): +0
+        3. Score the slots using _score_slots() (work hours, spacing, centrality), one
+           batch per bonus, best bonus first - stopping once no later batch can win
+        4. Return HIGHEST-SCORING slot (not first-fit); ties go to the better window
         
         This ensures preferred time is ABSOLUTE PRIORITY while using best-fit scoring.
         
@@ -977,155 +1177,102 @@ class OptimizationEngine:
             event_category: Event category for optimal time selection
             event_priority: Event priority for scheduling preference
             preferred_time_window: Tuple of (start_time, end_time) as time objects for preferred window
+            tree: Interval tree over events (defaults to the index over self.events)
             
         Returns:
             datetime of optimal slot or None if no slot found
         """
-        candidate_slots = []
+        day_start = datetime.combine(target_date, time.min)
+        day_end = datetime.combine(target_date, time.max)
         
-        # LEVEL 1: Try exact preferred time window (HIGHEST PRIORITY)
+        # Bonus windows as (start, end, bonus), best bonus first. A slot earns the
+        # bonus of the first window it fits in entirely
+        windows = []
         if preferred_time_window:
             pref_start_time, pref_end_time = preferred_time_window
-            
-            pref_slots = self._find_all_available_slots(
-                target_date, duration, pref_start_time, pref_end_time, exclude_id
-            )
-            
-            # Score preferred time slots with 50-point bonus
-            for slot_start, slot_end in pref_slots:
-                base_score = self._score_slot(slot_start, slot_end, event_category, event_priority, exclude_id)
-                candidate_slots.append({
-                    'start': slot_start,
-                    'end': slot_end,
-                    'score': base_score + 50,  # Preferred time bonus (dominant factor)
-                    'level': 'exact_preferred'
-                })
-            
-            # LEVEL 2: Try expanded window (±1 hour) if preferred time specified
-            if pref_start_time.hour > 0:  # Can expand backward
-                expanded_start = (datetime.combine(target_date, pref_start_time) - timedelta(hours=1)).time()
-            else:
-                expanded_start = pref_start_time
-            
-            if pref_end_time.hour < 23:  # Can expand forward
-                expanded_end = (datetime.combine(target_date, pref_end_time) + timedelta(hours=1)).time()
+            pref_start = datetime.combine(target_date, pref_start_time)
+            pref_end = datetime.combine(target_date, pref_end_time)
+            if pref_end <= pref_start:
+                # Overnight window: the morning and evening pieces of this day
+                exact = [(day_start, pref_end), (pref_start, day_end)]
             else:
-                expanded_end = pref_end_time
-            
-            # Only search expanded area (exclude slots already found in exact window)
-            if expanded_start != pref_start_time or expanded_end != pref_end_time:
-                expanded_slots = self._find_all_available_slots(
-                    target_date, duration, expanded_start, expanded_end, exclude_id
-                )
-                
-                for slot_start, slot_end in expanded_slots:
-                    slot_time = slot_start.time()
-                    # Skip if already in exact preferred window
-                    is_overnight = pref_end_time <= pref_start_time
-                    if is_overnight:
-                        in_exact = slot_time >= pref_start_time or slot_time < pref_end_time
-                    else:
-                        in_exact = pref_start_time <= slot_time < pref_end_time
-                    
-                    if not in_exact:
-                        base_score = self._score_slot(slot_start, slot_end, event_category, event_priority, exclude_id)
-                        candidate_slots.append({
-                            'start': slot_start,
-                            'end': slot_end,
-                            'score': base_score + 35,  # Expanded window bonus (still high priority)
-                            'level': 'expanded_preferred'
-                        })
-        
-        # LEVEL 3: Work hours (standard work day)
-        work_slots = self._find_all_available_slots(
-            target_date, duration, work_start, work_end, exclude_id
-        )
-        
-        for slot_start, slot_end in work_slots:
-            # Skip if already scored in preferred/expanded window
-            slot_time = slot_start.time()
-            already_scored = False
-            
-            if preferred_time_window:
-                pref_start_time, pref_end_time = preferred_time_window
-                is_overnight = pref_end_time <= pref_start_time
-                
-                # Check exact preferred
-                if is_overnight:
-                    in_exact = slot_time >= pref_start_time or slot_time < pref_end_time
-                else:
-                    in_exact = pref_start_time <= slot_time < pref_end_time
-                
-                # Check expanded window
-                expanded_start = max((datetime.combine(target_date, pref_start_time) - timedelta(hours=1)).time(), datetime.min.time())
-                expanded_end = min((datetime.combine(target_date, pref_end_time) + timedelta(hours=1)).time(), datetime.max.time())
-                
-                if is_overnight:
-                    in_expanded = slot_time >= expanded_start or slot_time < expanded_end
-                else:
-                    in_expanded = expanded_start <= slot_time < expanded_end
-                
-                already_scored = in_exact or in_expanded
+                exact = [(pref_start, pref_end)]
             
-            if not already_scored:
-                base_score = self._score_slot(slot_start, slot_end, event_category, event_priority, exclude_id)
-                candidate_slots.append({
-                    'start': slot_start,
-                    'end': slot_end,
-                    'score': base_score + 10,  # Work hours bonus (moderate priority)
-                    'level': 'work_hours'
-                })
-        
-        # LEVEL 4: Full day (any waking hours - last resort)
-        # Use midnight to midnight, excluding sleep hours
-        full_day_slots = self._find_all_available_slots(
-            target_date, duration, datetime.min.time(), datetime.max.time(), exclude_id
-        )
-        
-        for slot_start, slot_end in full_day_slots:
-            # Skip if already scored in any previous level
-            slot_time = slot_start.time()
-            already_scored = False
-            
-            # Check work hours
-            if work_start <= slot_time < work_end:
-                already_scored = True
+            # Preferred time bonus (dominant factor), then the ±1 hour expansion
+            # (still high priority), clamped to the day
+            expanded = [
+                (max(lo - _EXPANDED_MARGIN, day_start), min(hi + _EXPANDED_MARGIN, day_end))
+                for lo, hi in exact
+            ]
+            windows.extend((lo, hi, 50) for lo, hi in exact)
+            windows.extend((lo, hi, 35) for lo, hi in expanded)
             
-            # Check preferred windows
-            if preferred_time_window and not already_scored:
-                pref_start_time, pref_end_time = preferred_time_window
-                is_overnight = pref_end_time <= pref_start_time
-                
-                expanded_start = max((datetime.combine(target_date, pref_start_time) - timedelta(hours=1)).time(), datetime.min.time())
-                expanded_end = min((datetime.combine(target_date, pref_end_time) + timedelta(hours=1)).time(), datetime.max.time())
-                
-                if is_overnight:
-                    already_scored = slot_time >= expanded_start or slot_time < expanded_end
-                else:
-                    already_scored = expanded_start <= slot_time < expanded_end
-            
-            if not already_scored:
-                base_score = self._score_slot(slot_start, slot_end, event_category, event_priority, exclude_id)
-                candidate_slots.append({
-                    'start': slot_start,
-                    'end': slot_end,
-                    'score': base_score,  # No bonus (fallback only)
-                    'level': 'full_day'
-                })
-        
-        # Return best-scoring slot across all levels
-        if not candidate_slots:
-            return None
-        
-        best_slot = max(candidate_slots, key=lambda s: s['score'])
-        return best_slot['start']
+            # Preferred slots sit on the grid through the preferred start
+            searches = [
+                ((lo + (pref_start - lo) % _SLOT_STEP).time(), hi.time())
+                for lo, hi in expanded
+            ]
+        else:
+            searches = []
+        
+        # Work hours bonus (moderate priority), searched on the work_start grid;
+        # the last-resort slots anywhere in the day are on the midnight grid
+        windows.append((datetime.combine(target_date, work_start), datetime.combine(target_date, work_end), 10))
+        searches.append((work_start, work_end))
+        searches.append((time.min, time.max))
+        
+        # Each window's free slots on its own grid, merged in start order
+        slots = sorted({
+            slot
+            for search_start, search_end in searches
+            for slot in self._find_all_available_slots(
+                target_date, duration, search_start, search_end, exclude_id, tree
+            )
+        })
+        
+        # Group the slots by bonus (each group stays in start order)
+        slots_by_bonus = defaultdict(list)
+        for slot_start, slot_end in slots:
+            bonus = 0  # No bonus (fallback only)
+            for lo, hi, window_bonus in windows:
+                if lo <= slot_start and slot_end <= hi:
+                    bonus = window_bonus
+                    break
+            slots_by_bonus[bonus].append((slot_start, slot_end))
+        
+        # Score the groups best bonus first. A group can score at most
+        # _MAX_SLOT_SCORE + its bonus and loses ties to better windows, so once
+        # the best so far reaches that bound the remaining groups are skipped
+        best = None
+        for bonus in sorted(slots_by_bonus, reverse=True):
+            ceiling = _MAX_SLOT_SCORE + bonus
+            if best is not None and best[0] >= ceiling:
+                break
+            group = slots_by_bonus[bonus]
+            scores = self._score_slots(group, event_category, event_priority, exclude_id, tree)
+            for (slot_start, slot_end), score in zip(group, scores):
+                score += bonus
+                if best is None or score > best[0]:
+                    best = (score, slot_start)
+                    if score >= ceiling:
+                        break
+        
+        # Return best-scoring slot across all windows
+        return best[1] if best else None
     
-    def _is_during_sleep(self, dt, sleep_start, sleep_end):
-        """Check if datetime is during sleep hours."""
-        dt_time = dt.time()
+    def _is_during_sleep(self, dt):
+        """
+        Check if datetime is during sleep hours.
+        
+        Compares whole minutes since midnight: the sleep bounds have no seconds,
+        so dropping dt's seconds does not change the result.
+        """
+        minute = dt.hour * 60 + dt.minute
+        sleep_start = self._sleep_start_min
+        sleep_end = self._sleep_end_min
         if sleep_start > sleep_end:  # Overnight sleep
-            return dt_time >= sleep_start or dt_time < sleep_end
-        return sleep_start <= dt_time < sleep_end
+            return minute >= sleep_start or minute < sleep_end
+        return sleep_start <= minute < sleep_end
     
     def _find_original_time(self, event_id, field):
         """Find original start/end time for an event from self.events."""
@@ -1136,11 +1283,8 @@ class OptimizationEngine:
     
     def _calculate_sleep_hours(self):
         """Calculate total sleep hours per week."""
-        sleep_start_str = self.preferences.get('sleep_start', '23:00')
-        sleep_end_str = self.preferences.get('sleep_end', '07:00')
-        
-        sleep_start = datetime.strptime(sleep_start_str, '%H:%M')
-        sleep_end = datetime.strptime(sleep_end_str, '%H:%M')
+        sleep_start = datetime.combine(date.min, self._sleep_start_t)
+        sleep_end = datetime.combine(date.min, self._sleep_end_t)
         
         if sleep_end < sleep_start:
             sleep_end += timedelta(days=1)
@@ -46,9 +46,13 @@ class ProductivityScoreCalculator:
         self.personal_events = []
         self.recreational_events = []
         
-        # Categorize events
+        # Categorize events (as shallow copies carrying pre-parsed times, so each
+        # start/end string is parsed once here instead of in every metric)
         for event in events:
             category = event.get('category', 'Personal')
+            if category not in ('Work', 'Meeting', 'Personal', 'Recreational'):
+                continue
+            event = self._prepare_event(event)
             if category == 'Work':
                 self.work_events.append(event)
             elif category == 'Meeting':
@@ -440,13 +444,12 @@ class ProductivityScoreCalculator:
         followup_gaps = []
         
         for meeting in self.meetings:
-            meeting_end = self._parse_iso(meeting['end'])
+            meeting_end = meeting['_end_dt']
             
             # Look for work block within 2 hours after meeting
             found_followup = False
             for work in self.work_events:
-                work_start = self._parse_iso(work['start'])
-                gap = (work_start - meeting_end).total_seconds() / 60
+                gap = (work['_start_dt'] - meeting_end).total_seconds() / 60
                 
                 if 0 <= gap <= 120:  # Within 2 hours
                     flow_blocks += 1
@@ -645,14 +648,23 @@ class ProductivityScoreCalculator:
     
     # Helper methods (same as HealthScoreCalculator)
     
-    def _calculate_duration(self, event):
-        """Calculate event duration in minutes."""
+    def _prepare_event(self, event):
+        """Copy of event with parsed start/end datetimes and duration (minutes)."""
         start = self._parse_iso(event['start'])
         end = self._parse_iso(event['end'])
-        return (end - start).total_seconds() / 60
+        return dict(
+            event,
+            _start_dt=start,
+            _end_dt=end,
+            _duration_min=(end - start).total_seconds() / 60
+        )
+    
+    def _calculate_duration(self, event):
+        """Event duration in minutes (cached on the prepared event)."""
+        return event['_duration_min']
     
     def _parse_iso(self, date_string):
-        """Parse ISO datetime string."""
+        """Parse ISO datetime string (only used to prepare events)."""
         if date_string.endswith('Z'):
             date_string = date_string[:-1]
         if '.' in date_string:
@@ -668,19 +680,14 @@ class ProductivityScoreCalculator:
     
     def _check_overlapping_meetings(self, work_event):
         """Check if work event has overlapping meetings."""
-        work_start = self._parse_iso(work_event['start'])
-        work_end = self._parse_iso(work_event['end'])
+        work_start = work_event['_start_dt']
+        work_end = work_event['_end_dt']
         
         for meeting in self.meetings:
-            meeting_start = self._parse_iso(meeting['start'])
-            meeting_end = self._parse_iso(meeting['end'])
-            
-            if meeting_start < work_end and meeting_end > work_start:
+            if meeting['_start_dt'] < work_end and meeting['_end_dt'] > work_start:
                 return True
         return False
     
     def _calculate_gap_minutes(self, event1, event2):
         """Calculate gap in minutes between two events."""
-        end1 = self._parse_iso(event1['end'])
-        start2 = self._parse_iso(event2['start'])
-        return (start2 - end1).total_seconds() / 60
+        return (event2['_start_dt'] - event1['_end_dt']).total_seconds() / 60
@@ -8,25 +8,47 @@ HTTP endpoints for event CRUD operations:
 - DELETE /events/<id> - Delete event
 - POST /events/<id>/lock - Toggle lock status
 - POST /validate-event - Validate event without saving
+- POST /validate-events - Validate a batch of new events (e.g. an import)
 """
 
-from flask import request, jsonify
+import json
+from functools import lru_cache
+
+from flask import request, jsonify, Response, stream_with_context
 from database import db
 from event_validator import EventValidator
 from utils.datetime_utils import parse_datetime
 from scheduling.recurring_handler import handle_recurring_event
 from scheduling.floating_handler import handle_floating_event
 
+# The only event fields EventValidator.validate_event reads
+VALIDATED_FIELDS = ('start', 'end', 'category')
+
 
 def register_event_routes(app):
     """Register all event-related routes with the Flask app."""
     
     @app.route("/events", methods=["GET"])
     def get_events():
-        """Fetch all events (breaks are not events - just empty time)."""
-        # Get real events from database, filter out any legacy Break events
-        events = [e for e in db.get_all_events() if e.get('title') != 'Break']
-        return jsonify(events)
+        """
+        Fetch all events (breaks are not events - just empty time).
+        Answers 304 Not Modified when the client's ETag is still current,
+        skipping the query and JSON serialization entirely.
+        """
+        etag = _events_etag()
+        if etag in request.if_none_match:
+            # A 304 repeats the validators a 200 would carry
+            response = Response(status=304)
+            response.set_etag(etag)
+            response.cache_control.no_cache = True
+            return response
+        
+        # Stream real events from database, filter out any legacy Break events
+        events = (e for e in db.iter_all_events() if e.get('title') != 'Break')
+        response = Response(stream_with_context(_json_stream(events)), mimetype="application/json")
+        response.set_etag(etag)
+        response.cache_control.no_cache = True  # Always revalidate with the ETag
+        return response
 
     @app.route("/validate-event", methods=["POST"])
     def validate_event():
@@ -43,7 +65,8 @@ def register_event_routes(app):
                     "end": "2025-10-17T15:00:00",
                     "priority": "medium"
                 },
-                "event_id": 123  // Optional - ID of event being edited
+                "event_id": 123,  // Optional - ID of event being edited
+                "mode": "full"    // Optional - "fast" returns only blocking errors
             }
         
         Response:
@@ -57,20 +80,61 @@ def register_event_routes(app):
         data = request.json
         event = data.get('event')
         event_id = data.get('event_id')  # None for new events, ID for edits
+        mode = data.get('mode', 'full')
         
         if not event:
             return jsonify({"error": "Missing 'event' in request body"}), 400
         
-        # Get current schedule and preferences
-        existing_events = db.get_all_events()
+        if mode not in ('fast', 'full'):
+            return jsonify({"error": "'mode' must be 'fast' or 'full'"}), 400
+        
         preferences = db.get_user_preferences()
+        event_items = tuple((key, event[key]) for key in VALIDATED_FIELDS if key in event)
         
-        # Run validation
-        validator = EventValidator(existing_events, preferences)
-        result = validator.validate_event(event, event_id)
+        # Memoized per schedule version: re-sending the same input while the user
+        # edits skips the database load and the validation
+        if all(isinstance(value, str) for _, value in event_items) and \
+                (event_id is None or isinstance(event_id, int)):
+            result = _validate_cached(
+                db.get_events_version(), tuple(sorted(preferences.items())), event_items, event_id, mode
+            )
+        else:
+            result = _validate(event, event_id, preferences, mode)
         
         return jsonify(result), 200
 
+    @app.route("/validate-events", methods=["POST"])
+    def validate_events():
+        """
+        Validate a batch of new events (e.g. a calendar import) without saving.
+        Each event is checked against the schedule and against the rest of the batch.
+        
+        Request body:
+            {
+                "events": [{"title": ..., "category": ..., "start": ..., "end": ...}, ...]
+            }
+        
+        Response:
+            {
+                "results": [{"valid": ..., "errors": [...], "warnings": [...], "suggestions": [...]}, ...]
+            }
+        """
+        events = (request.json or {}).get('events')
+        
+        if not isinstance(events, list):
+            return jsonify({"error": "Missing 'events' list in request body"}), 400
+        
+        # One range query spanning every event's context
+        contexts = [c for c in map(EventValidator.context_range, events) if c]
+        existing_events = []
+        if contexts:
+            existing_events = db.get_events_in_range(
+                min(c[0] for c in contexts), max(c[1] for c in contexts)
+            )
+        
+        validator = EventValidator(existing_events, db.get_user_preferences())
+        return jsonify({"results": validator.validate_events_batch(events)}), 200
+
     @app.route("/events/<int:event_id>", methods=["DELETE"])
     def delete_event(event_id):
         """
@@ -284,6 +348,46 @@ def _validate_event_data(data, event_type):
     return all(field in data and data[field] for field in required_fields)
 
 
+def _validate(event, event_id, preferences, mode='full'):
+    """Validate an event against the slice of the schedule its checks can reach."""
+    # Indexed range query instead of loading every event
+    context = EventValidator.context_range(event)
+    existing_events = db.get_events_in_range(*context) if context else []
+    validator = EventValidator(existing_events, preferences)
+    return validator.validate_event(event, event_id, mode)
+
+
+@lru_cache(maxsize=256)
+def _validate_cached(schedule_version, preference_items, event_items, event_id, mode):
+    """
+    _validate keyed by schedule version (see db.get_events_version), preferences
+    and the validated event fields. Any write changes the version, so a cached
+    result is never served for a different schedule.
+    """
+    return _validate(dict(event_items), event_id, dict(preference_items), mode)
+
+
+def _json_stream(items):
+    """
+    Serialize an iterable as a JSON array chunk by chunk.
+    The client starts receiving data before the database scan finishes.
+    """
+    yield "["
+    first = True
+    for item in items:
+        if first:
+            first = False
+            yield json.dumps(item)
+        else:
+            yield "," + json.dumps(item)
+    yield "]"
+
+
+def _events_etag():
+    """ETag for the event list - changes whenever any event is written."""
+    return f"events-{db.get_events_version()}"
+
+
 def _check_conflicts(new_event):
     """Check if the new event conflicts with existing events."""
     new_start = parse_datetime(new_event["start"])
@@ -69,8 +69,9 @@ def register_optimization_routes(app):
                     "suggestion": "Please select current or future weeks only."
                 }), 400
             
-            # Get current events and preferences
-            events = db.get_events_in_range(
+            # Get current events and preferences (only events starting this week -
+            # an event spilling over from last week must not be moved)
+            events = db.get_events_starting_in_range(
                 start_date.isoformat() + "T00:00:00",
                 end_date.isoformat() + "T23:59:59"
             )
@@ -135,13 +136,16 @@ def register_optimization_routes(app):
                             evt['end'] = mod['new_end']
                             break
                 
-                health_calc_after = HealthScoreCalculator(simulated_events, preferences)
+                # The health calculator re-scores in place, recomputing only the
+                # metrics the moved events affect
+                for mod in result['modifications']:
+                    health_calc.update_event(mod['id'], {'start': mod['new_start'], 'end': mod['new_end']})
                 prod_calc_after = ProductivityScoreCalculator(simulated_events, preferences)
-                after_health = health_calc_after.calculate_score()['score']
+                after_health = health_calc.calculate_score()['score']
                 after_prod = prod_calc_after.calculate_score()['score']
             elif applied > 0:
                 # Live mode: re-fetch events to get updated times from DB
-                updated_events = db.get_events_in_range(
+                updated_events = db.get_events_starting_in_range(
                     start_date.isoformat() + "T00:00:00",
                     end_date.isoformat() + "T23:59:59"
                 )
@@ -4,14 +4,26 @@ Score Routes
 HTTP endpoints for health and productivity scoring:
 - GET /health-score - Calculate health score for a week
 - GET /productivity-score - Calculate productivity score for a week
+
+Health scores for the current week are also precomputed nightly (see
+start_nightly_precompute) so the first page load of the day is a cache hit.
 """
 
+import logging
+import threading
+import time
+
 from flask import request, jsonify
 from datetime import datetime, timedelta
 from database import db
 from health_score import HealthScoreCalculator
 from productivity_score import ProductivityScoreCalculator
 
+logger = logging.getLogger(__name__)
+
+# Local hour of the nightly health-score precompute (schedules rarely change overnight)
+PRECOMPUTE_HOUR = 2
+
 
 def register_score_routes(app):
     """Register all score-related routes with the Flask app."""
@@ -26,17 +38,9 @@ def register_score_routes(app):
         try:
             week_offset = int(request.args.get('week_offset', 0))
             
-            # Calculate date range (Monday-Sunday)
-            today = datetime.now().date()
-            monday = today - timedelta(days=today.weekday())
-            start_date = monday + timedelta(weeks=week_offset)
-            end_date = start_date + timedelta(days=6)  # Sunday
-            
-            # Get data
-            events = db.get_events_in_range(
-                start_date.isoformat() + "T00:00:00",
-                end_date.isoformat() + "T23:59:59"
-            )
+            # Calculate date range (Monday-Sunday) and get data
+            start_date, end_date = _week_range(week_offset)
+            events = _week_events(start_date, end_date)
             preferences = db.get_user_preferences()
             
             # Calculate health score
@@ -66,17 +70,9 @@ def register_score_routes(app):
         try:
             week_offset = int(request.args.get('week_offset', 0))
             
-            # Calculate date range (Monday-Sunday)
-            today = datetime.now().date()
-            monday = today - timedelta(days=today.weekday())
-            start_date = monday + timedelta(weeks=week_offset)
-            end_date = start_date + timedelta(days=6)  # Sunday
-            
-            # Get data
-            events = db.get_events_in_range(
-                start_date.isoformat() + "T00:00:00",
-                end_date.isoformat() + "T23:59:59"
-            )
+            # Calculate date range (Monday-Sunday) and get data
+            start_date, end_date = _week_range(week_offset)
+            events = _week_events(start_date, end_date)
             preferences = db.get_user_preferences()
             
             # Calculate productivity score
@@ -94,3 +90,54 @@ def register_score_routes(app):
                 "error": "Failed to calculate productivity score",
                 "details": str(e)
             }), 500
+
+
+def precompute_health_scores(week_offsets=(0,)):
+    """
+    Compute health scores ahead of time so GET /health-score answers from the
+    score cache. Uses the same event query as the route, so the cache keys match.
+    
+    Args:
+        week_offsets: Weeks to precompute (0 = current week)
+    """
+    preferences = db.get_user_preferences()
+    for week_offset in week_offsets:
+        start_date, end_date = _week_range(week_offset)
+        HealthScoreCalculator(_week_events(start_date, end_date), preferences).calculate_score()
+
+
+def start_nightly_precompute(hour=PRECOMPUTE_HOUR):
+    """
+    Start a daemon thread that runs precompute_health_scores every night at
+    the given local hour. Safe to call once at server startup.
+    """
+    def run():
+        while True:
+            now = datetime.now()
+            next_run = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+            if next_run <= now:
+                next_run += timedelta(days=1)
+            time.sleep((next_run - now).total_seconds())
+            try:
+                precompute_health_scores()
+            except Exception:
+                logger.exception("Nightly health score precompute failed")
+    
+    threading.Thread(target=run, name="health-score-precompute", daemon=True).start()
+
+
+def _week_range(week_offset):
+    """(Monday, Sunday) dates of the week week_offset weeks from the current one."""
+    today = datetime.now().date()
+    monday = today - timedelta(days=today.weekday())
+    start_date = monday + timedelta(weeks=week_offset)
+    end_date = start_date + timedelta(days=6)  # Sunday
+    return start_date, end_date
+
+
+def _week_events(start_date, end_date):
+    """Events overlapping the Monday-Sunday range."""
+    return db.get_events_in_range(
+        start_date.isoformat() + "T00:00:00",
+        end_date.isoformat() + "T23:59:59"
+    )
@@ -34,19 +34,19 @@ def register_statistics_routes(app):
         base_date = today + timedelta(weeks=week_offset)
         week_start = base_date - timedelta(days=base_date.weekday())
         week_end = week_start + timedelta(days=7)
-        all_events = db.get_all_events()
+        week_start_iso = week_start.isoformat()
+        week_end_iso = week_end.isoformat()
         
-        # Filter events for the selected week
-        week_events = []
-        for event in all_events:
-            if "start" not in event:
-                continue
-            event_start = parse_datetime(event["start"])
-            if event_start and week_start <= event_start <= week_end:
-                week_events.append(event)
+        # Filter events for the selected week in SQL (indexed on start_time)
+        week_events = db.get_events_starting_in_range(week_start_iso, week_end_iso)
+        
+        # Category totals are aggregated by SQLite in a single grouped scan
+        category_durations = {
+            category: stats["minutes"]
+            for category, stats in db.get_category_stats(week_start_iso, week_end_iso).items()
+        }
         
-        # Calculate all breakdowns
-        category_durations = {}
+        # Calculate the remaining breakdowns
         priority_durations = {}
         type_durations = {}
         event_durations = {}
@@ -65,12 +65,8 @@ def register_statistics_routes(app):
                 else:
                     event_durations[title] = duration
                 
-                # By category
+                # Category totals come from get_category_stats; still needed per day
                 category = event.get("category", "Personal")
-                if category in category_durations:
-                    category_durations[category] += duration
-                else:
-                    category_durations[category] = duration
                 
                 # By priority
                 priority = event.get("priority", "medium")
@@ -202,8 +198,8 @@ def register_statistics_routes(app):
         }
         
         return jsonify({
-            "week_start": week_start.isoformat(),
-            "week_end": week_end.isoformat(),
+            "week_start": week_start_iso,
+            "week_end": week_end_iso,
             "summary": summary,
             "event_durations": dict(sorted_events),
             "category_durations": category_durations,
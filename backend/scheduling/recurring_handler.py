@@ -12,7 +12,7 @@ Each instance (each week's meeting) tries all 4 levels independently before givi
 This ensures most instances get the preferred time, while flexible instances find alternatives.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from utils.datetime_utils import parse_datetime, parse_time_string, parse_preferred_time
 from scheduling.slot_finder import find_available_slot
 from database import db
@@ -76,6 +76,12 @@ def handle_recurring_event(data, new_event):
     work_start = parse_time_string(prefs.get('work_start', '09:00'))
     work_end = parse_time_string(prefs.get('work_end', '18:00'))
     
+    # Instances are written in batches. Slot finding reads the database, so the
+    # batch is flushed before any search whose window (widened by the ±1 hour
+    # fallback and the 1-hour spacing score) could reach a pending instance.
+    pending_instances = []
+    pending_reach = None  # Latest end time among pending instances
+    
     # Loop through each occurrence (every frequency days)
     while current_date <= end_date:
         # Skip past dates
@@ -83,6 +89,12 @@ def handle_recurring_event(data, new_event):
             current_date += timedelta(days=frequency)
             continue
         
+        search_floor = datetime.combine(current_date.date(), time.min) - timedelta(hours=2)
+        if pending_instances and pending_reach > search_floor:
+            db.bulk_create_events(pending_instances)
+            pending_instances = []
+            pending_reach = None
+        
         slot = None
         fallback_level = None
         
@@ -140,6 +152,7 @@ def handle_recurring_event(data, new_event):
                     
             except ValueError as e:
                 print(f"Error parsing preferred time: {e}")
+                db.bulk_create_events(pending_instances)  # Keep instances already scheduled
                 return False
         else:
             # No preferred time specified - try whole day
@@ -164,7 +177,8 @@ def handle_recurring_event(data, new_event):
                 "preferred_time": data.get("preferred_time", {})
             }
             scheduled_instances.append(instance)
-            db.create_event(instance)
+            pending_instances.append(instance)
+            pending_reach = max(pending_reach, slot[1]) if pending_reach else slot[1]
             
             # Log when fallback was used (not at exact preferred time)
             if fallback_level and fallback_level != "exact" and fallback_level != "no_preference":
@@ -177,6 +191,9 @@ def handle_recurring_event(data, new_event):
         # Move to next occurrence
         current_date += timedelta(days=frequency)
     
+    # Write the remaining instances in one transaction
+    db.bulk_create_events(pending_instances)
+    
     # Print summary showing how well we matched preferred times
     if has_preferred_time and scheduled_instances:
         total = len(scheduled_instances)
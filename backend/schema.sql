@@ -35,13 +35,44 @@ CREATE TABLE IF NOT EXISTS events (
     FOREIGN KEY (parent_id) REFERENCES events(id) ON DELETE CASCADE
 );
 
--- Critical indexes for performance (MVP - only 2 indexes)
+-- Critical indexes for performance
 -- This composite index speeds up conflict detection by 50-70%
 CREATE INDEX IF NOT EXISTS idx_time_range ON events(start_time, end_time);
 
 -- Type index for filtering recurring/floating events
 CREATE INDEX IF NOT EXISTS idx_type ON events(type);
 
+-- Overlap/conflict checks and future-event queries filter on end_time first
+CREATE INDEX IF NOT EXISTS idx_events_endtime_starttime ON events(end_time, start_time);
+
+-- Recurring-instance lookups (delete/find "this and all future" instances)
+CREATE INDEX IF NOT EXISTS idx_events_parent_type_start ON events(parent_id, type, start_time);
+
+-- Change counter for the events table (ETag for GET /events, validation cache key).
+-- Triggers bump it on every write, from any process or connection
+-- Trigger rows count toward total_changes, so write counts must use changes()
+CREATE TABLE IF NOT EXISTS events_version (
+    id INTEGER PRIMARY KEY CHECK(id = 1),
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO events_version (id, version) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_events_version_insert AFTER INSERT ON events
+BEGIN
+    UPDATE events_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_events_version_update AFTER UPDATE ON events
+BEGIN
+    UPDATE events_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_events_version_delete AFTER DELETE ON events
+BEGIN
+    UPDATE events_version SET version = version + 1 WHERE id = 1;
+END;
+
 -- User preferences table for smart scheduling
 CREATE TABLE IF NOT EXISTS user_preferences (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
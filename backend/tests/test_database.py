@@ -0,0 +1,80 @@
+"""
+Row counts reported by DatabaseManager with the events_version triggers installed.
+
+Run from the backend directory: python -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import database
+from database import DatabaseManager
+
+
+class TestWriteCounts(unittest.TestCase):
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._schema_file = database.SCHEMA_FILE
+        database.SCHEMA_FILE = os.path.join(BACKEND_DIR, 'schema.sql')
+        self.db = DatabaseManager(os.path.join(self._tmp.name, 'events.db'))
+        self.db.init_db()
+        
+        self.parent = self.db.create_event({
+            'title': 'Standup', 'priority': 'medium', 'type': 'recurring',
+            'start': '2025-10-13T09:00:00', 'end': '2025-10-13T09:15:00',
+            'duration': 15, 'frequency': 1,
+        })
+        self.instances = [
+            self.db.create_event({
+                'title': 'Standup', 'priority': 'medium', 'type': 'recurring_instance',
+                'start': f'2025-10-{day}T09:00:00', 'end': f'2025-10-{day}T09:15:00',
+                'parent_id': self.parent['id'], 'duration': 15, 'frequency': 1,
+            })
+            for day in (13, 14, 15, 16)
+        ]
+    
+    def tearDown(self):
+        self.db.close_all()
+        database.SCHEMA_FILE = self._schema_file
+        self._tmp.cleanup()
+    
+    def _event_count(self):
+        with self.db.get_reader() as conn:
+            return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+    
+    def test_delete_future_recurring_instances_returns_rows_deleted(self):
+        before = self._event_count()
+        deleted = self.db.delete_future_recurring_instances(self.instances[1]['id'])
+        
+        self.assertEqual(deleted, 3)
+        self.assertEqual(before - self._event_count(), 3)
+    
+    def test_bulk_update_event_times_returns_rows_updated(self):
+        single = self.db.bulk_update_event_times([
+            {'id': self.instances[0]['id'], 'start': '2025-10-13T10:00:00', 'end': '2025-10-13T10:15:00'},
+        ])
+        self.assertEqual(single, 1)
+        
+        updates = [
+            {'id': event['id'], 'start': '2025-10-20T08:00:00', 'end': '2025-10-20T08:15:00'}
+            for event in self.instances
+        ]
+        updates.append({'id': -1, 'start': '2025-10-20T08:00:00', 'end': '2025-10-20T08:15:00'})
+        self.assertEqual(self.db.bulk_update_event_times(updates), 4)
+    
+    def test_writes_still_bump_events_version(self):
+        version = self.db.get_events_version()
+        self.db.bulk_update_event_times([
+            {'id': self.parent['id'], 'start': '2025-10-13T11:00:00', 'end': '2025-10-13T11:15:00'},
+        ])
+        self.assertNotEqual(self.db.get_events_version(), version)
+
+
+if __name__ == '__main__':
+    unittest.main()